@@ -0,0 +1,327 @@
+"""Benchmarks for monitor generation, run them inside mayapy or Maya.
+
+    import monitor_bench
+    monitor_bench.bench_selection_paths(300)
+"""
+import contextlib
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+
+import maya.cmds as cmds
+
+from monitor_core import Monitor
+
+
+class SelectionMonitor(Monitor):
+    """Monitor that extrudes the panel through the active selection.
+
+    This is how _make_panel used to work, kept only as a baseline.
+    """
+    def _make_panel(self):
+        self.panel_height = self.height * self.panel_height_ratio
+        self.panel_depth = self.depth * self.panel_depth_ratio
+
+        panel = cmds.polyCube(width=self.width, depth=self.panel_depth,
+                              height=self.panel_height,
+                              name="panel")[0]
+        self.panel = panel
+
+        cmds.select(f'{panel}.f[0]')
+        cmds.polyExtrudeFacet(offset=self.screen_offset_amount)
+        correct_direction = self.screen_extrusion*-1
+        cmds.polyExtrudeFacet(localTranslateZ=correct_direction,
+                              offset=self.scrn_extrsn_offset_amount)
+
+        cmds.select(f'{panel}.f[2]')
+        cmds.polyExtrudeFacet(offset=self.b_panel_offset)
+        cmds.polyExtrudeFacet(localTranslateZ=self.b_panel_extrsn,
+                              offset=self.b_panel_extrsn_offset)
+
+        y_offset3 = self.panel_height*.5 + self.height*self.base_height_ratio + self.height*self.neck_height_ratio
+        cmds.xform(panel, translation=[0, y_offset3, 0])
+
+
+def time_monitors(monitor, count):
+    """Return the seconds taken to build count monitors in a new scene"""
+    cmds.file(new=True, force=True)
+    start = time.perf_counter()
+    for _ in range(count):
+        monitor.make_monitor()
+    return time.perf_counter() - start
+
+
+def bench_selection_paths(count=300):
+    """Compare selection based and selection-free panel extrusions"""
+    results = {
+        'selection': time_monitors(SelectionMonitor(), count),
+        'selection_free': time_monitors(Monitor(), count),
+    }
+    for name, seconds in results.items():
+        print(f"{name:>15}: {seconds:.3f}s "
+              f"({seconds / count * 1000.0:.3f} ms/monitor)")
+    print(f"Speedup: {results['selection'] / results['selection_free']:.2f}x")
+    return results
+
+
+def bench_preset_placement(name, count=20):
+    """Compare procedural (cold) and baked (warm) placement of a preset"""
+    from monitor_presets import PresetLibrary
+
+    library = PresetLibrary()
+    if not library.has_baked(name):
+        library.bake(name)
+    results = {}
+    for mode in ('cold', 'warm'):
+        cmds.file(new=True, force=True)
+        start = time.perf_counter()
+        for _ in range(count):
+            if mode == 'cold':
+                monitor = Monitor()
+                monitor.set_params(library.load(name))
+                monitor.make_monitor()
+            else:
+                library.place(name)
+        results[mode] = time.perf_counter() - start
+    for mode, seconds in results.items():
+        print(f"{mode:>5}: {seconds / count * 1000.0:.3f} ms/placement")
+    return results
+
+
+def bench_batches(recorder, sizes=(1, 100, 10000)):
+    """Build batches against monitor_stub and return per-monitor figures.
+
+    recorder is the RecordingCmds returned by monitor_stub.install().
+    """
+    results = {}
+    for size in sizes:
+        recorder.reset()
+        specs = [{'width': 60.0 + i % 10} for i in range(size)]
+        start = time.perf_counter()
+        Monitor().make_monitors(specs)
+        wall = time.perf_counter() - start
+        results[str(size)] = {
+            'calls_per_monitor': sum(recorder.calls.values()) / size,
+            'nodes_per_monitor': recorder.nodes_created / size,
+            'synthetic_ms_per_monitor':
+                recorder.synthetic_seconds / size * 1000.0,
+            'wall_ms_per_monitor': wall / size * 1000.0,
+        }
+    return results
+
+
+# modules a headless "import monitor_gen" must not pull in
+UI_MODULES = ('PySide2', 'shiboken2', 'maya.OpenMayaUI', 'monitor_ui')
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+import monitor_stub
+monitor_stub.install()
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds,
+                  'modules': sorted(name for name in {forbidden!r}
+                                    if name in sys.modules)}}))
+"""
+
+
+def bench_import(module='monitor_gen', runs=5, forbidden=UI_MODULES):
+    """Return (best import seconds, forbidden modules it loaded).
+
+    Every run is a fresh interpreter with the recording maya.cmds stand-in,
+    so only the cost of module itself is measured.
+    """
+    script = _IMPORT_SCRIPT.format(module=module, forbidden=forbidden)
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script],
+                                cwd=here,
+                                check=True, stdout=subprocess.PIPE,
+                                universal_newlines=True).stdout
+        result = json.loads(output.splitlines()[-1])
+        best = (result['seconds'] if best is None
+                else min(best, result['seconds']))
+        loaded.update(result['modules'])
+    return best, sorted(loaded)
+
+
+def find_regressions(results, baselines, tolerance=0.5):
+    """Return a message per figure that got worse than its baseline.
+
+    Call and node counts must not grow at all; timings may exceed their
+    baseline by the tolerance fraction, plus 0.1 ms for the tiny batches,
+    to absorb machine noise.
+    """
+    regressions = []
+    for size, figures in results.items():
+        for name, value in figures.items():
+            baseline = baselines.get(size, {}).get(name)
+            if baseline is None:
+                continue
+            limit = baseline
+            if name.endswith('_ms_per_monitor'):
+                limit = baseline * (1.0 + tolerance) + 0.1
+            if value > limit + 1e-9:
+                regressions.append(f"batch {size}: {name} {value:.4f} > "
+                                   f"baseline {baseline:.4f}")
+    return regressions
+
+
+def bench_output_modes(count=100):
+    """Print the DG nodes and time per monitor of every output mode"""
+    from monitor_core import OUTPUT_MODES
+
+    results = {}
+    for mode in OUTPUT_MODES:
+        cmds.file(new=True, force=True)
+        monitor = Monitor()
+        monitor.output_mode = mode
+        nodes_before = len(cmds.ls())
+        start = time.perf_counter()
+        for _ in range(count):
+            monitor.make_monitor()
+        seconds = time.perf_counter() - start
+        results[mode] = {
+            'nodes_per_monitor': (len(cmds.ls()) - nodes_before) / count,
+            'ms_per_monitor': seconds / count * 1000.0,
+        }
+        print(f"{mode:>9}: {results[mode]['nodes_per_monitor']:.1f} nodes, "
+              f"{results[mode]['ms_per_monitor']:.3f} ms per monitor")
+    return results
+
+
+def bench_naming_scaling(chunks=10, chunk_size=200):
+    """Print ms per monitor as the scene fills, fixed vs allocated names.
+
+    With the fixed "panel"/"monitor" names every new monitor makes Maya
+    resolve a clash against all the previous ones; allocated names should
+    keep the per-chunk time flat.
+    """
+    from monitor_core import NameAllocator
+
+    results = {}
+    for mode in ('fixed', 'allocated'):
+        cmds.file(new=True, force=True)
+        monitor = Monitor()
+        if mode == 'allocated':
+            monitor.naming = NameAllocator()
+        timings = []
+        for _ in range(chunks):
+            start = time.perf_counter()
+            for _ in range(chunk_size):
+                monitor.make_monitor()
+            timings.append((time.perf_counter() - start) / chunk_size)
+        results[mode] = timings
+        print(f"{mode:>9}: " + " ".join(f"{seconds * 1000.0:.3f}"
+                                        for seconds in timings)
+              + " ms/monitor per chunk")
+    return results
+
+
+def check_naming_scaling(recorder, chunks=10, chunk_size=200,
+                         max_ratio=1.2):
+    """Return (ratio per mode, failures) for chunked builds on the stub.
+
+    Like bench_naming_scaling, but against monitor_stub, which charges for
+    name clashes and wildcard scans, so the figures are synthetic and
+    repeatable. "allocated" builds the chunks the way the drivers do, with
+    make_monitors under one shared_naming(); its last chunk must not cost
+    more than max_ratio times its first. "fixed" is the clashing baseline,
+    reported to show what the check would catch.
+    """
+    ratios = {}
+    for mode in ('fixed', 'allocated'):
+        recorder.reset()
+        monitor = Monitor()
+        naming = (monitor.shared_naming() if mode == 'allocated'
+                  else contextlib.nullcontext())
+        timings = []
+        with naming:
+            for _ in range(chunks):
+                start = recorder.synthetic_seconds
+                if mode == 'allocated':
+                    monitor.make_monitors([{}] * chunk_size, quiet=True)
+                else:
+                    for _ in range(chunk_size):
+                        monitor.make_monitor()
+                timings.append(recorder.synthetic_seconds - start)
+        ratios[mode] = timings[-1] / timings[0]
+    failures = []
+    if ratios['allocated'] > max_ratio:
+        failures.append(f"chunk {chunks} costs {ratios['allocated']:.2f}x "
+                        f"chunk 1, over {max_ratio}x")
+    return ratios, failures
+
+
+def bench_incremental(count=2000, edits=10):
+    """Print a full build vs a sync after editing a few specs.
+
+    The edits regenerate one monitor, move one and delete one in turn, so
+    the second sync should cost a fraction of the first.
+    """
+    import monitor_manifest
+
+    cmds.file(new=True, force=True)
+    monitor = Monitor()
+    specs = [{'id': f"desk{i:05d}", 'width': 60.0 + i % 10}
+             for i in range(count)]
+    start = time.perf_counter()
+    monitor_manifest.sync(monitor, specs)
+    full = time.perf_counter() - start
+
+    for i in range(edits):
+        index = i * (count // edits)
+        if i % 3 == 0:
+            specs[index] = dict(specs[index], width=75.0)
+        elif i % 3 == 1:
+            specs[index] = dict(specs[index], translate=[0.0, 0.0, 500.0])
+        else:
+            specs[index] = None
+    specs = [spec for spec in specs if spec is not None]
+    start = time.perf_counter()
+    changes = monitor_manifest.sync(monitor, specs)
+    incremental = time.perf_counter() - start
+    print(f"full build {full:.3f}s, sync after {edits} edits "
+          f"{incremental:.3f}s ({changes})")
+    return full, incremental
+
+
+def bench_viewport(count=2000, frames=120):
+    """Print viewport FPS orbiting a layout, real monitors vs proxies.
+
+    Run it in interactive Maya: mayapy has no viewport to draw, so refresh
+    returns at once there.
+    """
+    import monitor_layout
+    import monitor_proxy
+
+    columns = int(math.ceil(math.sqrt(count)))
+    layout = monitor_layout.grid(int(math.ceil(count / columns)), columns)
+    specs = list(monitor_layout.to_specs([{}] * count, layout))
+    results = {}
+    for mode in ('monitors', 'proxies'):
+        cmds.file(new=True, force=True)
+        monitor = Monitor()
+        start = time.perf_counter()
+        if mode == 'proxies':
+            monitor_proxy.make_proxies(monitor, specs)
+        else:
+            monitor.make_monitors(specs)
+        build = time.perf_counter() - start
+        cmds.viewFit('persp', all=True)
+        cmds.refresh(force=True)
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            cmds.orbit('persp', horizontalAngle=360.0 / frames)
+            cmds.refresh(currentView=True, force=True)
+        fps = frames / (time.perf_counter() - start)
+        results[mode] = {'build_seconds': build, 'fps': fps}
+        print(f"{mode:>9}: built in {build:.3f}s, {fps:.1f} fps")
+    return results
@@ -0,0 +1,187 @@
+"""Generate monitors headless from a CSV or JSONL spec file.
+
+Run it with mayapy:
+
+    mayapy monitor_cli.py specs.jsonl -o monitors.mb
+
+Every CSV row / JSONL line is a {parameter: value} spec overriding the Monitor
+defaults. Specs are streamed in batches, so the file never sits in memory.
+
+With --incremental an existing output scene is opened and synced with the
+specs through monitor_manifest instead: only the monitors whose spec changed
+are rebuilt, moved or deleted. Give the specs an "id" to keep them matched
+when lines are inserted or removed.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+
+from monitor_geo import SPEC_ID_KEY
+
+
+def iter_specs(path):
+    """Yield one {name: float} spec per CSV row or JSONL line"""
+    with open(path, newline='') as spec_file:
+        if path.lower().endswith('.csv'):
+            for row in csv.DictReader(spec_file):
+                yield {name: _to_float(name, value)
+                       for name, value in row.items()
+                       if value not in (None, '')}
+        else:
+            for line in spec_file:
+                line = line.strip()
+                if line:
+                    yield {name: _to_float(name, value)
+                           for name, value in json.loads(line).items()}
+
+
+def _to_float(name, value):
+    if name == SPEC_ID_KEY:
+        return str(value)
+    # placement values such as translate are [x, y, z] lists
+    if isinstance(value, list):
+        return [float(item) for item in value]
+    return float(value)
+
+
+def iter_batches(specs, batch_size):
+    specs = iter(specs)
+    while True:
+        batch = list(itertools.islice(specs, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of this process in MB, or None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    if sys.platform == 'darwin':
+        return peak / (1024.0*1024.0)
+    return peak / 1024.0
+
+
+def save_scene(cmds, path):
+    file_type = 'mayaAscii' if path.lower().endswith('.ma') else 'mayaBinary'
+    cmds.file(rename=os.path.abspath(path))
+    cmds.file(save=True, type=file_type, force=True)
+
+
+def generate(spec_path, output, batch_size=500, backend="cmds",
+             use_cache=False, invalid=None, incremental=False,
+             disk_cache=None, disk_cache_mb=512, triangle_budget=None,
+             camera=(0.0, 0.0, 0.0)):
+    """Build every spec of a file into a new scene and save it"""
+    import maya.cmds as cmds
+    from monitor_core import GeometryCache, Monitor, NameAllocator
+
+    if incremental and os.path.isfile(output):
+        cmds.file(output, open=True, force=True)
+    else:
+        cmds.file(new=True, force=True)
+    monitor = Monitor()
+    monitor.backend = backend
+    # one name prefix for the whole run, not one per batch
+    monitor.naming = NameAllocator()
+    if use_cache:
+        monitor.cache = GeometryCache()
+    if disk_cache:
+        from monitor_meshcache import MeshCache
+        monitor.disk_cache = MeshCache(disk_cache, max_mb=disk_cache_mb)
+
+    count = 0
+    rejected = 0
+    start = time.perf_counter()
+    if incremental:
+        import monitor_manifest
+        changes = monitor_manifest.sync(monitor, iter_specs(spec_path))
+        count = changes['created'] + changes['regenerated']
+    elif triangle_budget:
+        # the levels depend on the whole layout, so it is read at once
+        import monitor_lod
+        count = len(monitor_lod.make_budgeted(monitor, iter_specs(spec_path),
+                                              triangle_budget, camera))
+    else:
+        for batch in iter_batches(iter_specs(spec_path), batch_size):
+            count += len(monitor.make_monitors(batch, invalid=invalid))
+            if invalid is not None:
+                rejected += len(monitor.last_batch_stats['rejected'])
+    generate_time = time.perf_counter() - start
+    save_scene(cmds, output)
+    total_time = time.perf_counter() - start
+
+    rate = count / generate_time if generate_time else 0.0
+    print(f"Monitors: {count}")
+    if invalid is not None:
+        print(f"Invalid specs skipped: {rejected}")
+    print(f"Generation: {generate_time:.3f}s ({rate:.1f} monitors/sec)")
+    print(f"Total with save: {total_time:.3f}s")
+    peak = peak_rss_mb()
+    if peak is not None:
+        print(f"Peak RSS: {peak:.1f} MB")
+    if monitor.cache is not None:
+        print(f"Cache: {monitor.cache.stats()}")
+    if monitor.disk_cache is not None:
+        stats = monitor.disk_cache.stats()
+        print(f"Disk cache: {stats['hit_rate']:.1%} hit rate "
+              f"({stats['hits']} hits, {stats['misses']} misses), "
+              f"{stats['bytes_read'] / 1024.0:.1f} KB read, "
+              f"{stats['evicted']} evicted")
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('specs', help="CSV or JSONL file of monitor specs")
+    parser.add_argument('-o', '--output', required=True,
+                        help="scene file to write (.ma or .mb)")
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help="specs built per undo chunk")
+    parser.add_argument('--backend', choices=("cmds", "api"), default="cmds")
+    parser.add_argument('--cache', action='store_true',
+                        help="instance monitors with identical parameters")
+    parser.add_argument('--invalid', choices=("skip", "clamp"),
+                        help="validate specs first and skip, or clamp where "
+                             "possible, the invalid ones")
+    parser.add_argument('--disk-cache', metavar='DIR',
+                        help="mesh cache directory shared across sessions")
+    parser.add_argument('--disk-cache-mb', type=float, default=512,
+                        help="evict least recently used meshes past this")
+    parser.add_argument('--triangle-budget', type=int,
+                        help="pick a level of detail per monitor, nearest "
+                             "to --camera first, to stay under this")
+    parser.add_argument('--camera', type=float, nargs=3,
+                        default=(0.0, 0.0, 0.0), metavar=('X', 'Y', 'Z'))
+    parser.add_argument('--incremental', action='store_true',
+                        help="update an existing output scene, only "
+                             "rebuilding the changed specs")
+    args = parser.parse_args(argv)
+    if args.incremental and args.invalid:
+        parser.error("--invalid does not apply to --incremental runs")
+    if args.triangle_budget and (args.incremental or args.invalid):
+        parser.error("--triangle-budget cannot be combined with "
+                     "--incremental or --invalid")
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    try:
+        generate(args.specs, args.output, batch_size=args.batch_size,
+                 backend=args.backend, use_cache=args.cache,
+                 invalid=args.invalid, incremental=args.incremental,
+                 disk_cache=args.disk_cache, disk_cache_mb=args.disk_cache_mb,
+                 triangle_budget=args.triangle_budget, camera=args.camera)
+    finally:
+        maya.standalone.uninitialize()
+
+
+if __name__ == '__main__':
+    main()
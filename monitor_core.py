@@ -0,0 +1,570 @@
+import contextlib
+import math
+import sys
+import time
+import uuid
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+import monitor_geo
+from monitor_geo import (DEFAULT_PARAMS, MONITOR_PARAMS, PLACEMENT_KEYS,
+                         SPEC_ID_KEY, spec_hash)
+
+OUTPUT_MODES = ("history", "baked", "combined")
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def _no_phase(name):
+    return _NULL_CONTEXT
+
+
+def set_transforms(nodes, translations, rotations=None, scales=None):
+    """Set the transforms of many nodes in one OpenMaya pass.
+
+    translations, rotations (XYZ degrees) and scales hold one [x, y, z] per
+    node. Like any direct OpenMaya edit this is not undoable.
+    """
+    selection = om.MSelectionList()
+    for node in nodes:
+        selection.add(node)
+    fn_transform = om.MFnTransform()
+    for i in range(selection.length()):
+        fn_transform.setObject(selection.getDagPath(i))
+        fn_transform.setTranslation(om.MVector(translations[i]),
+                                    om.MSpace.kTransform)
+        if rotations is not None:
+            fn_transform.setRotation(
+                om.MEulerRotation(*(math.radians(angle)
+                                    for angle in rotations[i])),
+                om.MSpace.kTransform)
+        if scales is not None:
+            fn_transform.setScale(scales[i])
+
+
+class NameAllocator(object):
+    """Hand out monitor node names that never clash.
+
+    The allocator reserves a random prefix no node uses yet, checked once,
+    then numbers monitors with a counter. Maya never has to resolve a name
+    clash, so naming costs the same however many monitors the scene holds.
+    """
+    def __init__(self, base="mon"):
+        self.prefix = self._free_prefix(base)
+        self.count = 0
+
+    def next_monitor(self):
+        """Return the name prefix of the next monitor"""
+        self.count += 1
+        return f"{self.prefix}{self.count:06d}"
+
+    @staticmethod
+    def _free_prefix(base):
+        while True:
+            prefix = f"{base}_{uuid.uuid4().hex[:8]}_"
+            if not cmds.ls(f"{prefix}*"):
+                return prefix
+
+
+class GeometryCache(object):
+    """Reuse already generated monitors as instances or duplicates.
+
+    Masters are tracked by node UUID so renaming them keeps the entry valid,
+    while deleting them invalidates it on the next lookup.
+    """
+    def __init__(self, use_instances=True):
+        self.use_instances = use_instances
+        self.masters = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        """Return the master group for a spec hash, or None on a miss"""
+        master = self._resolve(key)
+        if master is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return master
+
+    def add(self, key, master):
+        self.masters[key] = cmds.ls(master, uuid=True)[0]
+
+    def copy(self, master, name="monitor"):
+        """Return a new instance or duplicate of a master group"""
+        if self.use_instances:
+            return cmds.instance(master, name=name)[0]
+        return cmds.duplicate(master, name=name)[0]
+
+    def invalidate(self, key=None):
+        """Forget one spec hash, or every master when no key is given"""
+        if key is None:
+            self.masters.clear()
+        else:
+            self.masters.pop(key, None)
+
+    def prune(self):
+        """Drop the entries whose master node has been deleted"""
+        for key in list(self.masters):
+            self._resolve(key)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'masters': len(self.masters)}
+
+    def _resolve(self, key):
+        uuid = self.masters.get(key)
+        if uuid is None:
+            return None
+        nodes = cmds.ls(uuid, long=True)
+        if not nodes:
+            del self.masters[key]
+            return None
+        return nodes[0]
+
+
+class Monitor(object):
+    def __init__(self):
+        self.panel = ''
+        self.neck = ''
+        self.base = ''
+
+        self.set_params(DEFAULT_PARAMS)
+
+        self.cache = None
+        # a monitor_meshcache.MeshCache shared across sessions, or None;
+        # monitors built from it have no construction history
+        self.disk_cache = None
+        # "cmds" keeps polyCube/polyExtrudeFacet history, "api" builds each
+        # part from monitor_geo with one MFnMesh.create, no history and no
+        # undo
+        self.backend = "cmds"
+        # remember the nodes of the last cmds monitor for update_monitor
+        self.track_history = False
+        # a monitor_profile.Profiler to time phases and commands, or None
+        self.profiler = None
+        # "history" keeps the construction history, "baked" deletes it and
+        # "combined" makes panel, neck and base one history-free mesh
+        self.output_mode = "history"
+        self.freeze_transforms = False
+        # monitor_geo.lod_meshes level; above 0 every monitor is a single
+        # history-free mesh of that level
+        self.lod_level = 0
+        # a NameAllocator for clash-free names; make_monitors always uses
+        # one, a single make_monitor keeps the plain "monitor"/"panel" names
+        self.naming = None
+        self._monitor_name = None
+
+        self._reset()
+
+    @property
+    def undoable(self):
+        """Whether make_monitor builds only with undoable cmds calls.
+
+        The api backend, combined output, disk cache hits and lod levels
+        above 0 create their meshes through OpenMaya, which Maya does not
+        record for undo.
+        """
+        return (self.backend == "cmds" and self.output_mode != "combined"
+                and self.disk_cache is None and not self.lod_level)
+
+    def _make_base(self):
+        self.base_width = self.width * self.base_width_ratio
+        self.base_depth = self.depth * self.base_depth_ratio
+
+        base, base_cube = cmds.polyCube(
+                                    width=self.base_width,
+                                    depth=self.base_depth,
+                                    height=self.height*self.base_height_ratio,
+                                    name=self._node_name("base"))
+        self.base = base
+        self.history['base'] = base_cube
+
+        y_offset1 = self.height*self.base_height_ratio*.5
+        cmds.xform(base, translation=[0, y_offset1, 0])
+
+    def _make_neck(self):
+        self.neck_width = self.width * self.neck_width_ratio
+        self.neck_depth = self.depth * self.neck_depth_ratio
+
+        neck, neck_cube = cmds.polyCube(
+                                    width=self.neck_width,
+                                    depth=self.neck_depth,
+                                    height=self.height*self.neck_height_ratio,
+                                    name=self._node_name("neck"))
+        self.neck = neck
+        self.history['neck'] = neck_cube
+
+        y_offset2 = (
+      self.height*self.neck_height_ratio)*.5+self.height*self.base_height_ratio
+        cmds.xform(neck, translation=[0, y_offset2, 0])
+
+    def _make_panel(self):
+        self.panel_height = self.height * self.panel_height_ratio
+        self.panel_depth = self.depth * self.panel_depth_ratio
+
+        panel, panel_cube = cmds.polyCube(width=self.width,
+                                          depth=self.panel_depth,
+                                          height=self.panel_height,
+                                          name=self._node_name("panel"))
+        self.panel = panel
+        self.history['panel'] = panel_cube
+
+        # Extrusions name their face explicitly, the cap keeps its index, so
+        # the active selection is never touched
+        screen = f'{panel}.f[0]'
+        self.history['screen_inset'] = cmds.polyExtrudeFacet(
+                                        screen,
+                                        offset=self.screen_offset_amount)[0]
+        correct_direction = self.screen_extrusion*-1
+        self.history['screen_extrusion'] = cmds.polyExtrudeFacet(
+                                screen,
+                                localTranslateZ=correct_direction,
+                                offset=self.scrn_extrsn_offset_amount)[0]
+
+        back = f'{panel}.f[2]'
+        self.history['back_inset'] = cmds.polyExtrudeFacet(
+                                              back,
+                                              offset=self.b_panel_offset)[0]
+        self.history['back_extrusion'] = cmds.polyExtrudeFacet(
+                                    back,
+                                    localTranslateZ=self.b_panel_extrsn,
+                                    offset=self.b_panel_extrsn_offset)[0]
+
+        y_offset3 = self.panel_height*.5 + self.height*self.base_height_ratio + self.height*self.neck_height_ratio
+        cmds.xform(panel, translation=[0, y_offset3, 0])
+
+    def _make_parts_api(self, parts=None):
+        if parts is None:
+            parts = monitor_geo.monitor_meshes(self.get_params())
+        for name, mesh, y_offset in parts:
+            setattr(self, name, self._create_mesh(self._node_name(name),
+                                                  mesh, y_offset))
+
+    def _create_mesh(self, name, mesh, y_offset):
+        # outside an MPxCommand Maya does not record this for undo
+        fn_mesh = om.MFnMesh()
+        transform = fn_mesh.create([om.MPoint(*pnt) for pnt in mesh.points],
+                                   mesh.face_counts, mesh.face_connects)
+        fn_mesh.setName(f"{name}Shape")
+        fn_transform = om.MFnTransform(transform)
+        fn_transform.setName(name)
+        fn_transform.setTranslation(om.MVector(0, y_offset, 0),
+                                    om.MSpace.kTransform)
+        cmds.sets(fn_mesh.fullPathName(), edit=True,
+                  forceElement="initialShadingGroup")
+        return fn_transform.partialPathName()
+
+    def _make_combined(self, parts=None):
+        self._reset_parts()
+        if parts is None:
+            parts = monitor_geo.monitor_meshes(self.get_params())
+        mesh = monitor_geo.combine(parts)
+        # the part offsets are already in the points, nothing to freeze
+        group = self._create_mesh(self._node_name("monitor"), mesh, 0.0)
+        if self._monitor_name is None:
+            return group
+        # a new mesh is made at the world, like in _grp_objects
+        return f"|{group}"
+
+    def _read_parts(self):
+        """Return [(name, MeshData, y_offset)] of the built panel/neck/base"""
+        parts = []
+        for name in ("panel", "neck", "base"):
+            selection = om.MSelectionList()
+            selection.add(getattr(self, name))
+            dag_path = selection.getDagPath(0)
+            y_offset = om.MFnTransform(dag_path).translation(
+                                                    om.MSpace.kTransform).y
+            fn_mesh = om.MFnMesh(dag_path.extendToShape())
+            face_counts, face_connects = fn_mesh.getVertices()
+            points = [(point.x, point.y, point.z)
+                      for point in fn_mesh.getPoints(om.MSpace.kObject)]
+            parts.append((name, monitor_geo.MeshData(
+                points, list(face_counts), list(face_connects)), y_offset))
+        return parts
+
+    def _bake(self, group):
+        cmds.delete(group, constructionHistory=True)
+        if self.freeze_transforms:
+            cmds.makeIdentity(group, apply=True, translate=True, rotate=True,
+                              scale=True)
+        self.history = {}
+        self.live_transforms = {}
+
+    def _grp_objects(self):
+        stand = cmds.group([self.neck, self.base],
+                           name=self._node_name("stand"))
+        group = cmds.group([self.panel, stand],
+                           name=self._node_name("monitor"))
+        if self._monitor_name is None:
+            return group
+        # allocated names are unique, so the full paths are known up front
+        group = f"|{group}"
+        self.panel = f"{group}|{self.panel}"
+        self.neck = f"{group}|{stand}|{self.neck}"
+        self.base = f"{group}|{stand}|{self.base}"
+        return group
+
+    def _node_name(self, part):
+        if self._monitor_name is None:
+            return part
+        return f"{self._monitor_name}_{part}"
+
+    def _reset(self):
+        self._reset_parts()
+        self.master_grp_name = 'monitor_grp'
+        self.history = {}
+        self.live_transforms = {}
+        self.last_batch_stats = {}
+
+    def _reset_parts(self):
+        self.base = ''
+        self.neck = ''
+        self.panel = ''
+
+    def get_params(self):
+        """Return the monitor parameters as a {name: value} spec"""
+        return {name: getattr(self, name) for name in MONITOR_PARAMS}
+
+    def set_params(self, spec):
+        """Set the monitor parameters from a {name: value} spec"""
+        for name, value in spec.items():
+            if name not in MONITOR_PARAMS:
+                raise ValueError(f"Unknown monitor parameter: {name}")
+            setattr(self, name, value)
+
+    def make_monitor(self):
+        if self.profiler is None:
+            return self._make_monitor(_no_phase)
+        with self.profiler.monitor(), \
+                self.profiler.commands(sys.modules[__name__]):
+            return self._make_monitor(self.profiler.phase)
+
+    def _make_monitor(self, phase):
+        self.history = {}
+        self.live_transforms = {}
+        self._monitor_name = None
+        if self.naming is not None:
+            self._monitor_name = self.naming.next_monitor()
+        if self.cache is not None:
+            with phase("cache"):
+                key = spec_hash(self.get_params())
+                if self.lod_level:
+                    key = f"{key}:lod{self.lod_level}"
+                master = self.cache.lookup(key)
+                if master is not None:
+                    copy = self.cache.copy(master,
+                                           self._node_name("monitor"))
+                    # the copy lands next to its master, not always at the
+                    # world, so look its full path up
+                    copy = cmds.ls(copy, long=True)[0]
+                    # it also copies the master's placement, start from the
+                    # origin like a newly built monitor
+                    cmds.xform(copy, translation=(0.0, 0.0, 0.0),
+                               rotation=(0.0, 0.0, 0.0),
+                               scale=(1.0, 1.0, 1.0))
+                    return copy
+
+        if self.output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown output mode: {self.output_mode}")
+        if self.lod_level:
+            with phase("lod"):
+                group = self._make_combined(monitor_geo.lod_meshes(
+                                        self.get_params(), self.lod_level))
+            if self.cache is not None:
+                self.cache.add(key, group)
+            return group
+
+        disk_key = parts = None
+        if self.disk_cache is not None:
+            with phase("disk_cache"):
+                disk_key = self.disk_cache.key(self.get_params())
+                parts = self.disk_cache.load(disk_key)
+
+        if self.output_mode == "combined":
+            if disk_key is not None and parts is None:
+                parts = monitor_geo.monitor_meshes(self.get_params())
+                self.disk_cache.store(disk_key, parts)
+            with phase("combined"):
+                group = self._make_combined(parts)
+            if self.cache is not None:
+                self.cache.add(key, group)
+            return group
+
+        # a disk cache hit is built like the api backend, without history
+        if parts is not None or self.backend == "api":
+            with phase("api_parts"):
+                self._make_parts_api(parts)
+        else:
+            with phase("panel"):
+                self._make_panel()
+            with phase("neck"):
+                self._make_neck()
+            with phase("base"):
+                self._make_base()
+            if self.track_history:
+                self.live_transforms = {
+                    name: cmds.ls(getattr(self, name), uuid=True)[0]
+                    for name in ("panel", "neck", "base")}
+        with phase("group"):
+            group = self._grp_objects()
+        if self.output_mode == "baked":
+            with phase("bake"):
+                self._bake(group)
+        if disk_key is not None and parts is None:
+            with phase("disk_cache"):
+                self.disk_cache.store(disk_key, self._read_parts())
+
+        if self.cache is not None:
+            self.cache.add(key, group)
+        return group
+
+    def update_monitor(self):
+        """Push the current parameters into the last monitor's history.
+
+        Only monitors built by the cmds backend with track_history on can be
+        updated in place. Returns False when there is nothing to update.
+        """
+        transforms = self._resolve_live_transforms()
+        if transforms is None:
+            return False
+
+        params = self.get_params()
+        history = self.history
+        self.panel_height = self.height * self.panel_height_ratio
+        self.panel_depth = self.depth * self.panel_depth_ratio
+        self._set_attrs(history['panel'], width=self.width,
+                        height=self.panel_height, depth=self.panel_depth)
+        self._set_attrs(history['screen_inset'],
+                        offset=self.screen_offset_amount)
+        self._set_attrs(history['screen_extrusion'],
+                        localTranslateZ=self.screen_extrusion*-1,
+                        offset=self.scrn_extrsn_offset_amount)
+        self._set_attrs(history['back_inset'], offset=self.b_panel_offset)
+        self._set_attrs(history['back_extrusion'],
+                        localTranslateZ=self.b_panel_extrsn,
+                        offset=self.b_panel_extrsn_offset)
+
+        self.neck_width = self.width * self.neck_width_ratio
+        self.neck_depth = self.depth * self.neck_depth_ratio
+        self._set_attrs(history['neck'], width=self.neck_width,
+                        height=self.height*self.neck_height_ratio,
+                        depth=self.neck_depth)
+
+        self.base_width = self.width * self.base_width_ratio
+        self.base_depth = self.depth * self.base_depth_ratio
+        self._set_attrs(history['base'], width=self.base_width,
+                        height=self.height*self.base_height_ratio,
+                        depth=self.base_depth)
+
+        for name, y_offset in zip(("base", "neck", "panel"),
+                                  monitor_geo.stack_offsets(params)):
+            cmds.xform(transforms[name], translation=[0, y_offset, 0])
+        return True
+
+    def _resolve_live_transforms(self):
+        if not self.live_transforms:
+            return None
+        if not all(cmds.objExists(node) for node in self.history.values()):
+            return None
+        transforms = {}
+        for name, uuid in self.live_transforms.items():
+            nodes = cmds.ls(uuid, long=True)
+            if not nodes:
+                return None
+            transforms[name] = nodes[0]
+        return transforms
+
+    @staticmethod
+    def _set_attrs(node, **values):
+        for attr, value in values.items():
+            cmds.setAttr(f"{node}.{attr}", value)
+
+    @contextlib.contextmanager
+    def shared_naming(self):
+        """Use one NameAllocator for every make_monitors call inside.
+
+        Each allocator checks the scene for a free prefix once, so a driver
+        calling make_monitors many times should hold one for the whole run.
+        """
+        naming = self.naming
+        if naming is None:
+            self.naming = NameAllocator()
+        try:
+            yield self.naming
+        finally:
+            self.naming = naming
+
+    def make_monitors(self, specs, invalid=None, quiet=False):
+        """Build one monitor per spec and return the monitor group names.
+
+        Each spec only overrides the current parameters of this instance.
+        The whole batch is a single undo chunk and the viewport does not
+        refresh until it is done. Only cmds-built monitors undo cleanly
+        (see undoable): meshes made with MFnMesh.create are not recorded
+        for undo, so undoing the chunk leaves them behind and they have to
+        be deleted instead. Specs with translate/rotate/scale values
+        are placed in one set_transforms pass at the end.
+
+        With invalid set to "skip" or "clamp" the batch is checked by
+        monitor_validate first: bad specs are skipped, or clamped into range
+        where possible, without any Maya call. Their reasons are kept in
+        last_batch_stats. quiet leaves out the printed batch summary.
+        """
+        base_params = self.get_params()
+        naming = self.naming
+        groups = []
+        placed = []
+        start = time.perf_counter()
+        preflight = None
+        if invalid is not None:
+            import monitor_validate
+            preflight = monitor_validate.preflight(specs, invalid,
+                                                   base=base_params)
+            specs = preflight.specs
+        cmds.undoInfo(openChunk=True, chunkName="make_monitors")
+        cmds.refresh(suspend=True)
+        if naming is None:
+            self.naming = NameAllocator()
+        try:
+            for spec in specs:
+                params = dict(spec)
+                params.pop(SPEC_ID_KEY, None)
+                placement = {key: params.pop(key)
+                             for key in PLACEMENT_KEYS if key in params}
+                self.set_params(base_params)
+                self.set_params(params)
+                groups.append(self.make_monitor())
+                if placement:
+                    placed.append((groups[-1], placement))
+            if placed:
+                set_transforms(
+                    [group for group, _ in placed],
+                    [placement.get('translate', (0.0, 0.0, 0.0))
+                     for _, placement in placed],
+                    [placement.get('rotate', (0.0, 0.0, 0.0))
+                     for _, placement in placed],
+                    [placement.get('scale', (1.0, 1.0, 1.0))
+                     for _, placement in placed])
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
+            self.set_params(base_params)
+            self.naming = naming
+        elapsed = time.perf_counter() - start
+        self.last_batch_stats = {'count': len(groups), 'seconds': elapsed}
+        rate = len(groups) / elapsed if elapsed else 0.0
+        if not quiet:
+            print(f"Generated {len(groups)} monitors in {elapsed:.3f}s "
+                  f"({rate:.1f} monitors/sec)")
+        if preflight is not None:
+            self.last_batch_stats.update(rejected=preflight.rejected,
+                                         clamped=preflight.clamped)
+            if not quiet and (preflight.rejected or preflight.clamped):
+                print(f"Skipped {len(preflight.rejected)} invalid specs, "
+                      f"clamped {len(preflight.clamped)}")
+        return groups
@@ -0,0 +1,319 @@
+"""Write monitors to OBJ or binary glTF without Maya.
+
+    python monitor_export.py specs.jsonl -o monitors.glb
+
+Specs are the same {parameter: value} dicts monitor_cli reads, plus the
+optional translate/rotate/scale placement. Monitors are written one at a
+time and memory does not grow with the batch: geometry and the glTF JSON
+are streamed to temporary files, and at most MESH_CACHE_SIZE distinct
+meshes are kept, least recently used first out. In glTF each distinct mesh
+is stored once and every monitor is a node referencing it (a spec seen
+again after its mesh was evicted gets a second copy); OBJ has no
+instancing, so the shared mesh is transformed and written out for every
+monitor.
+"""
+import argparse
+import collections
+import json
+import math
+import os
+import shutil
+import struct
+import tempfile
+import time
+
+import monitor_geo
+
+
+# distinct meshes a writer keeps for reuse
+MESH_CACHE_SIZE = 1024
+
+
+class ObjWriter(object):
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self.unique_meshes = 0
+        self._meshes = collections.OrderedDict()
+        self._vertex_count = 0
+        self._file = open(path, 'w')
+        self._file.write("# monitor_export\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, spec):
+        params, placement = monitor_geo.split_spec(spec)
+        key = monitor_geo.spec_hash(params)
+        mesh = _cached(self._meshes, key)
+        if mesh is None:
+            mesh = monitor_geo.combine(monitor_geo.monitor_meshes(params))
+            _store(self._meshes, key, mesh)
+            self.unique_meshes += 1
+        matrix = placement_matrix(placement)
+
+        self.count += 1
+        lines = [f"o monitor{self.count}"]
+        lines.extend("v {:.6f} {:.6f} {:.6f}".format(
+                                            *_transform_point(matrix, point))
+                     for point in mesh.points)
+        start = self._vertex_count + 1
+        face_start = 0
+        for face_count in mesh.face_counts:
+            face = mesh.face_connects[face_start:face_start + face_count]
+            lines.append("f " + " ".join(str(start + i) for i in face))
+            face_start += face_count
+        self._vertex_count += len(mesh.points)
+        self._file.write("\n".join(lines) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class GlbWriter(object):
+    """Binary glTF writer.
+
+    Mesh data and every JSON array are streamed to temporary files, then
+    assembled into the .glb on close.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._meshes = collections.OrderedDict()
+        self._bin = tempfile.TemporaryFile()
+        self._bin_size = 0
+        self._arrays = collections.OrderedDict(
+            (name, _JsonArray())
+            for name in ('nodes', 'meshes', 'accessors', 'bufferViews'))
+        self._scene_nodes = _JsonArray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def unique_meshes(self):
+        return self._arrays['meshes'].count
+
+    def add(self, spec):
+        params, placement = monitor_geo.split_spec(spec)
+        key = monitor_geo.spec_hash(params)
+        mesh_index = _cached(self._meshes, key)
+        if mesh_index is None:
+            mesh_index = self._write_mesh(
+                    monitor_geo.combine(monitor_geo.monitor_meshes(params)))
+            _store(self._meshes, key, mesh_index)
+
+        self.count += 1
+        node = {'name': f"monitor{self.count}", 'mesh': mesh_index}
+        if 'translate' in placement:
+            node['translation'] = list(placement['translate'])
+        if 'rotate' in placement:
+            node['rotation'] = euler_to_quaternion(placement['rotate'])
+        if 'scale' in placement:
+            node['scale'] = list(placement['scale'])
+        self._scene_nodes.append(self._arrays['nodes'].append(node))
+
+    def _write_mesh(self, mesh):
+        flat_points = [value for point in mesh.points for value in point]
+        indices = monitor_geo.triangulate(mesh)
+        accessors = self._arrays['accessors']
+
+        position_view = self._write_view(
+                struct.pack(f'<{len(flat_points)}f', *flat_points), 34962)
+        index_view = self._write_view(
+                struct.pack(f'<{len(indices)}I', *indices), 34963)
+
+        position_accessor = accessors.append({
+            'bufferView': position_view, 'componentType': 5126,
+            'count': len(mesh.points), 'type': 'VEC3',
+            'min': [min(point[axis] for point in mesh.points)
+                    for axis in range(3)],
+            'max': [max(point[axis] for point in mesh.points)
+                    for axis in range(3)],
+        })
+        index_accessor = accessors.append({
+            'bufferView': index_view, 'componentType': 5125,
+            'count': len(indices), 'type': 'SCALAR',
+        })
+        return self._arrays['meshes'].append({'primitives': [{
+            'attributes': {'POSITION': position_accessor},
+            'indices': index_accessor,
+        }]})
+
+    def _write_view(self, data, target):
+        # glTF wants every view 4-byte aligned
+        padding = -self._bin_size % 4
+        self._bin.write(b'\0' * padding)
+        self._bin_size += padding
+        view = self._arrays['bufferViews'].append({
+            'buffer': 0, 'byteOffset': self._bin_size,
+            'byteLength': len(data), 'target': target,
+        })
+        self._bin.write(data)
+        self._bin_size += len(data)
+        return view
+
+    def close(self):
+        bin_padding = -self._bin_size % 4
+        head = {'asset': {'version': '2.0', 'generator': 'monitor_export'},
+                'scene': 0}
+        if self._bin_size:
+            head['buffers'] = [{'byteLength': self._bin_size + bin_padding}]
+        # the JSON chunk is written piece by piece, the arrays straight from
+        # their temporary files
+        pieces = [_json_bytes(head)[:-1] + b',"scenes":[{"nodes":',
+                  self._scene_nodes, b'}]']
+        for name, array in self._arrays.items():
+            pieces.extend([f',"{name}":'.encode('ascii'), array])
+        pieces.append(b'}')
+        json_size = sum(len(piece) if isinstance(piece, bytes)
+                        else piece.nbytes for piece in pieces)
+        json_padding = -json_size % 4
+
+        total = 12 + 8 + json_size + json_padding
+        if self._bin_size:
+            total += 8 + self._bin_size + bin_padding
+        with open(self.path, 'wb') as glb_file:
+            glb_file.write(struct.pack('<4sII', b'glTF', 2, total))
+            glb_file.write(struct.pack('<II', json_size + json_padding,
+                                       0x4E4F534A))
+            for piece in pieces:
+                if isinstance(piece, bytes):
+                    glb_file.write(piece)
+                else:
+                    piece.write_to(glb_file)
+            glb_file.write(b' ' * json_padding)
+            if self._bin_size:
+                glb_file.write(struct.pack(
+                    '<II', self._bin_size + bin_padding, 0x004E4942))
+                self._bin.seek(0)
+                shutil.copyfileobj(self._bin, glb_file)
+                glb_file.write(b'\0' * bin_padding)
+        self._bin.close()
+        self._scene_nodes.close()
+        for array in self._arrays.values():
+            array.close()
+
+
+class _JsonArray(object):
+    """A JSON array whose items are streamed to a temporary file"""
+    def __init__(self):
+        self.count = 0
+        self._file = tempfile.TemporaryFile()
+        self._size = 0
+
+    @property
+    def nbytes(self):
+        return self._size + 2
+
+    def append(self, value):
+        """Add an item, return its index"""
+        data = _json_bytes(value)
+        if self.count:
+            data = b',' + data
+        self._file.write(data)
+        self._size += len(data)
+        self.count += 1
+        return self.count - 1
+
+    def write_to(self, out_file):
+        out_file.write(b'[')
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, out_file)
+        out_file.write(b']')
+
+    def close(self):
+        self._file.close()
+
+
+WRITERS = {'.obj': ObjWriter, '.glb': GlbWriter}
+
+
+def export(specs, path):
+    """Write every spec to an .obj or .glb file, return the monitor count"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unsupported export format: {extension}")
+
+    start = time.perf_counter()
+    with WRITERS[extension](path) as writer:
+        for spec in specs:
+            writer.add(spec)
+    elapsed = time.perf_counter() - start
+    rate = writer.count / elapsed if elapsed else 0.0
+    print(f"Exported {writer.count} monitors ({writer.unique_meshes} unique "
+          f"meshes) to {path} in {elapsed:.3f}s ({rate:.1f} monitors/sec)")
+    return writer.count
+
+
+def euler_to_quaternion(rotate):
+    """Return the [x, y, z, w] quaternion of XYZ-order euler degrees"""
+    half = [math.radians(angle)*.5 for angle in rotate]
+    cx, cy, cz = (math.cos(angle) for angle in half)
+    sx, sy, sz = (math.sin(angle) for angle in half)
+    return [sx*cy*cz - cx*sy*sz,
+            cx*sy*cz + sx*cy*sz,
+            cx*cy*sz - sx*sy*cz,
+            cx*cy*cz + sx*sy*sz]
+
+
+def placement_matrix(placement):
+    """Return the 3x4 row-major matrix of a translate/rotate/scale placement"""
+    sx, sy, sz = placement.get('scale', (1.0, 1.0, 1.0))
+    rx, ry, rz = (math.radians(angle)
+                  for angle in placement.get('rotate', (0.0, 0.0, 0.0)))
+    tx, ty, tz = placement.get('translate', (0.0, 0.0, 0.0))
+    cx, cy, cz = math.cos(rx), math.cos(ry), math.cos(rz)
+    snx, sny, snz = math.sin(rx), math.sin(ry), math.sin(rz)
+    # Maya's XYZ rotate order applies X first: R = Rz * Ry * Rx
+    rotation = (
+        (cy*cz, snx*sny*cz - cx*snz, cx*sny*cz + snx*snz),
+        (cy*snz, snx*sny*snz + cx*cz, cx*sny*snz - snx*cz),
+        (-sny, snx*cy, cx*cy),
+    )
+    return [(row[0]*sx, row[1]*sy, row[2]*sz, offset)
+            for row, offset in zip(rotation, (tx, ty, tz))]
+
+
+def _transform_point(matrix, point):
+    return tuple(row[0]*point[0] + row[1]*point[1] + row[2]*point[2] + row[3]
+                 for row in matrix)
+
+
+def _cached(cache, key):
+    """Return a cache item and mark it recently used, None on a miss"""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _store(cache, key, value):
+    cache[key] = value
+    if len(cache) > MESH_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _json_bytes(value):
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def main(argv=None):
+    import monitor_cli
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('specs', help="CSV or JSONL file of monitor specs")
+    parser.add_argument('-o', '--output', required=True,
+                        help="file to write (.obj or .glb)")
+    args = parser.parse_args(argv)
+    export(monitor_cli.iter_specs(args.specs), args.output)
+
+
+if __name__ == '__main__':
+    main()
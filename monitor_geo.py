@@ -0,0 +1,247 @@
+"""Analytic monitor geometry, computed without Maya.
+
+The meshes match what Monitor builds with polyCube and polyExtrudeFacet:
+same faces, same extrusion insets and translations, so the result can be
+handed to a single MFnMesh.create call or written to disk.
+"""
+import collections
+import hashlib
+
+
+MONITOR_PARAMS = (
+    'width', 'height', 'depth',
+    'panel_height_ratio', 'panel_depth_ratio',
+    'screen_offset_amount', 'scrn_extrsn_offset_amount', 'screen_extrusion',
+    'b_panel_offset', 'b_panel_extrsn_offset', 'b_panel_extrsn',
+    'neck_width_ratio', 'neck_height_ratio', 'neck_depth_ratio',
+    'base_width_ratio', 'base_height_ratio', 'base_depth_ratio',
+)
+
+PLACEMENT_KEYS = ('translate', 'rotate', 'scale')
+
+# optional spec key naming a monitor for monitor_manifest, not a parameter
+SPEC_ID_KEY = 'id'
+
+# lod_meshes levels, from the most detailed
+LOD_LEVELS = ('full', 'simple', 'proxy')
+
+DEFAULT_PARAMS = {
+    'width': 90.0, 'height': 60.0, 'depth': 15.0,
+    'panel_height_ratio': 0.9, 'panel_depth_ratio': 0.15,
+    'screen_offset_amount': .5, 'scrn_extrsn_offset_amount': .05,
+    'screen_extrusion': .05,
+    'b_panel_extrsn_offset': 1.0, 'b_panel_offset': 5.0,
+    'b_panel_extrsn': 0.0,
+    'neck_width_ratio': 0.2, 'neck_height_ratio': 0.1,
+    'neck_depth_ratio': 0.1,
+    'base_width_ratio': 0.3, 'base_height_ratio': .05,
+    'base_depth_ratio': .05,
+}
+
+MeshData = collections.namedtuple('MeshData',
+                                  'points face_counts face_connects')
+
+
+def full_params(spec):
+    """Return the defaults overridden by a partial {name: value} spec"""
+    params = dict(DEFAULT_PARAMS)
+    for name, value in spec.items():
+        if name not in MONITOR_PARAMS:
+            raise ValueError(f"Unknown monitor parameter: {name}")
+        params[name] = float(value)
+    return params
+
+
+def split_spec(spec):
+    """Split a spec into its full parameters and its placement.
+
+    The placement holds the optional translate, rotate (XYZ degrees) and
+    scale values, each an [x, y, z] list. A spec id is ignored.
+    """
+    placement = {key: spec[key] for key in PLACEMENT_KEYS if key in spec}
+    params = full_params({name: value for name, value in spec.items()
+                          if name not in PLACEMENT_KEYS
+                          and name != SPEC_ID_KEY})
+    return params, placement
+
+
+def spec_hash(params):
+    """Return a stable hash of a full {name: value} monitor spec"""
+    key = ';'.join(f"{name}={float(params[name]):.6f}"
+                   for name in MONITOR_PARAMS)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def box(width, height, depth):
+    """Return the points and faces of a polyCube centered at the origin"""
+    x, y, z = width*.5, height*.5, depth*.5
+    points = [
+        (-x, -y, z), (x, -y, z), (-x, y, z), (x, y, z),
+        (-x, y, -z), (x, y, -z), (-x, -y, -z), (x, -y, -z),
+    ]
+    faces = [
+        [0, 1, 3, 2],  # front
+        [2, 3, 5, 4],  # top
+        [4, 5, 7, 6],  # back
+        [6, 7, 1, 0],  # bottom
+        [1, 7, 5, 3],  # right
+        [6, 0, 2, 4],  # left
+    ]
+    return points, faces
+
+
+def extrude_face(points, faces, face_index, offset=0.0, translate_z=0.0):
+    """Extrude a quad in place, like polyExtrudeFacet on a single face.
+
+    Every edge of the face is inset by offset and the new cap is moved by
+    translate_z along the face normal. The cap keeps face_index and the side
+    faces are appended.
+    """
+    face = faces[face_index]
+    count = len(face)
+    normal = _face_normal([points[i] for i in face])
+
+    new_ids = []
+    for i, vtx_id in enumerate(face):
+        vtx = points[vtx_id]
+        to_next = _normalize(_sub(points[face[(i+1) % count]], vtx))
+        to_prev = _normalize(_sub(points[face[i-1]], vtx))
+        new_ids.append(len(points))
+        points.append(tuple(vtx[axis]
+                            + offset*(to_next[axis] + to_prev[axis])
+                            + translate_z*normal[axis]
+                            for axis in range(3)))
+
+    for i in range(count):
+        j = (i+1) % count
+        faces.append([face[i], face[j], new_ids[j], new_ids[i]])
+    faces[face_index] = new_ids
+
+
+def stack_offsets(params):
+    """Return the y translations of the base, neck and panel"""
+    base_height = params['height']*params['base_height_ratio']
+    neck_height = params['height']*params['neck_height_ratio']
+    panel_height = params['height']*params['panel_height_ratio']
+    return (base_height*.5,
+            neck_height*.5 + base_height,
+            panel_height*.5 + base_height + neck_height)
+
+
+def panel_mesh(params):
+    points, faces = box(params['width'],
+                        params['height']*params['panel_height_ratio'],
+                        params['depth']*params['panel_depth_ratio'])
+    extrude_face(points, faces, 0, offset=params['screen_offset_amount'])
+    extrude_face(points, faces, 0,
+                 offset=params['scrn_extrsn_offset_amount'],
+                 translate_z=params['screen_extrusion']*-1)
+    extrude_face(points, faces, 2, offset=params['b_panel_offset'])
+    extrude_face(points, faces, 2,
+                 offset=params['b_panel_extrsn_offset'],
+                 translate_z=params['b_panel_extrsn'])
+    return _mesh_data(points, faces)
+
+
+def neck_mesh(params):
+    return _mesh_data(*box(params['width']*params['neck_width_ratio'],
+                           params['height']*params['neck_height_ratio'],
+                           params['depth']*params['neck_depth_ratio']))
+
+
+def base_mesh(params):
+    return _mesh_data(*box(params['width']*params['base_width_ratio'],
+                           params['height']*params['base_height_ratio'],
+                           params['depth']*params['base_depth_ratio']))
+
+
+def monitor_meshes(params):
+    """Return [(name, mesh, y_offset)] for the panel, neck and base"""
+    base_y, neck_y, panel_y = stack_offsets(params)
+    return [("panel", panel_mesh(params), panel_y),
+            ("neck", neck_mesh(params), neck_y),
+            ("base", base_mesh(params), base_y)]
+
+
+def lod_meshes(params, level=0):
+    """Return the [(name, mesh, y_offset)] of one level of detail.
+
+    0 is monitor_meshes, 1 leaves out the screen and back extrusions and 2
+    is a single box around the whole monitor.
+    """
+    if level == 0:
+        return monitor_meshes(params)
+    if level == 1:
+        panel = _mesh_data(*box(params['width'],
+                                params['height']*params['panel_height_ratio'],
+                                params['depth']*params['panel_depth_ratio']))
+        base_y, neck_y, panel_y = stack_offsets(params)
+        return [("panel", panel, panel_y),
+                ("neck", neck_mesh(params), neck_y),
+                ("base", base_mesh(params), base_y)]
+    if level == 2:
+        # the bounds of the full monitor, extrusions included
+        points = combine(monitor_meshes(params)).points
+        low = [min(axis) for axis in zip(*points)]
+        high = [max(axis) for axis in zip(*points)]
+        center = [(a + b)*.5 for a, b in zip(low, high)]
+        proxy_points, faces = box(*(b - a for a, b in zip(low, high)))
+        proxy_points = [(x + center[0], y, z + center[2])
+                        for x, y, z in proxy_points]
+        return [("proxy", _mesh_data(proxy_points, faces), center[1])]
+    raise ValueError(f"Unknown level of detail: {level}")
+
+
+def triangle_count(parts):
+    """Return the triangles of [(name, mesh, y_offset)] once triangulated"""
+    return sum(count - 2 for _, mesh, _ in parts
+               for count in mesh.face_counts)
+
+
+def combine(parts):
+    """Merge [(name, mesh, y_offset)] into one mesh with offsets baked in"""
+    points, face_counts, face_connects = [], [], []
+    for _, mesh, y_offset in parts:
+        start = len(points)
+        points.extend((x, y + y_offset, z) for x, y, z in mesh.points)
+        face_counts.extend(mesh.face_counts)
+        face_connects.extend(start + i for i in mesh.face_connects)
+    return MeshData(points, face_counts, face_connects)
+
+
+def triangulate(mesh):
+    """Return the fan triangulated face connects as a flat index list"""
+    indices = []
+    face_start = 0
+    for face_count in mesh.face_counts:
+        face = mesh.face_connects[face_start:face_start + face_count]
+        for i in range(1, face_count - 1):
+            indices.extend((face[0], face[i], face[i+1]))
+        face_start += face_count
+    return indices
+
+
+def _mesh_data(points, faces):
+    return MeshData(points, [len(face) for face in faces],
+                    [i for face in faces for i in face])
+
+
+def _sub(a, b):
+    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
+
+
+def _normalize(vec):
+    length = (vec[0]**2 + vec[1]**2 + vec[2]**2)**.5
+    if not length:
+        return (0.0, 0.0, 0.0)
+    return (vec[0]/length, vec[1]/length, vec[2]/length)
+
+
+def _face_normal(face_points):
+    nx = ny = nz = 0.0
+    for i, current in enumerate(face_points):
+        nxt = face_points[(i+1) % len(face_points)]
+        nx += (current[1] - nxt[1]) * (current[2] + nxt[2])
+        ny += (current[2] - nxt[2]) * (current[0] + nxt[0])
+        nz += (current[0] - nxt[0]) * (current[1] + nxt[1])
+    return _normalize((nx, ny, nz))
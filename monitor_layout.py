@@ -0,0 +1,150 @@
+"""Vectorized monitor layouts: grids, desk rows, video walls, desk setups.
+
+Every layout returns a Placements of (N, 3) arrays: translate, rotate (XYZ
+euler degrees) and scale. Monitors face +Z, like Monitor builds them.
+
+    layout = desk_rows(rows=20, desks_per_row=40, monitors_per_desk=2)
+    groups = monitor.make_monitors([{}] * len(layout.translate))
+    apply(groups, layout)
+
+apply() sets every transform in one OpenMaya pass instead of an xform per
+node; to_specs() attaches the placements to specs for monitor_export or
+Monitor.make_monitors. Requires NumPy.
+"""
+import collections
+
+import numpy as np
+
+
+Placements = collections.namedtuple('Placements', 'translate rotate scale')
+
+
+def placements(translate, rotate=None, scale=None):
+    """Return Placements, rotate defaults to 0 and scale to 1"""
+    translate = np.asarray(translate, dtype=np.float64).reshape(-1, 3)
+    count = len(translate)
+    if rotate is None:
+        rotate = np.zeros((count, 3))
+    if scale is None:
+        scale = np.ones((count, 3))
+    return Placements(
+        translate,
+        np.broadcast_to(np.asarray(rotate, dtype=np.float64),
+                        (count, 3)).copy(),
+        np.broadcast_to(np.asarray(scale, dtype=np.float64),
+                        (count, 3)).copy())
+
+
+def concat(*layouts):
+    """Join several Placements into one"""
+    return Placements(*(np.concatenate([layout[i] for layout in layouts])
+                        for i in range(3)))
+
+
+def grid(rows, columns, spacing=(120.0, 120.0), origin=(0.0, 0.0, 0.0)):
+    """Monitors on a rows x columns grid in the XZ plane, centered on origin"""
+    x = (np.arange(columns) - (columns - 1) * .5) * spacing[0]
+    z = (np.arange(rows) - (rows - 1) * .5) * spacing[1]
+    xx, zz = np.meshgrid(x, z)
+    translate = np.column_stack((xx.ravel(), np.zeros(xx.size), zz.ravel()))
+    return placements(translate + np.asarray(origin, dtype=np.float64))
+
+
+def curved_wall(columns, rows, radius, arc=90.0, row_height=60.0,
+                center=(0.0, 0.0, 0.0)):
+    """A video wall on an arc around center, every monitor facing it.
+
+    The columns spread evenly over arc degrees on the -Z side of center and
+    the rows stack up by row_height.
+    """
+    angles = np.radians(np.linspace(-arc * .5, arc * .5, columns)
+                        if columns > 1 else np.zeros(1))
+    heights = np.arange(rows) * row_height
+    angle, height = np.meshgrid(angles, heights)
+    angle, height = angle.ravel(), height.ravel()
+
+    translate = np.column_stack((radius * np.sin(angle), height,
+                                 -radius * np.cos(angle)))
+    rotate = np.zeros((angle.size, 3))
+    rotate[:, 1] = -np.degrees(angle)
+    return placements(translate + np.asarray(center, dtype=np.float64),
+                      rotate)
+
+
+def multi_monitor_desk(count, monitor_width=90.0, viewing_distance=120.0,
+                       gap=2.0, center=(0.0, 0.0, 0.0)):
+    """Monitors side by side, toed in toward a viewer sitting in front.
+
+    center is the middle of the row of monitors; the viewer is
+    viewing_distance in front of it on +Z.
+    """
+    chord = monitor_width + gap
+    step = 2.0 * np.degrees(np.arcsin(min(1.0,
+                                          chord / (2.0*viewing_distance))))
+    viewer = np.asarray(center, dtype=np.float64) + (0.0, 0.0,
+                                                      viewing_distance)
+    return curved_wall(count, 1, viewing_distance, arc=step * (count - 1),
+                       center=viewer)
+
+
+def place_clusters(cluster, centers, yaw=0.0):
+    """Repeat a cluster layout at every center, turned by yaw degrees.
+
+    yaw is one angle for every cluster or one per center.
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    yaw = np.broadcast_to(np.asarray(yaw, dtype=np.float64), len(centers))
+    cos, sin = np.cos(np.radians(yaw)), np.sin(np.radians(yaw))
+
+    # (clusters, monitors) rotation of the cluster offsets around Y
+    x, y, z = (cluster.translate[:, axis] for axis in range(3))
+    translate = np.stack((cos[:, None]*x + sin[:, None]*z,
+                          np.broadcast_to(y, (len(centers), len(x))),
+                          -sin[:, None]*x + cos[:, None]*z), axis=-1)
+    translate += centers[:, None, :]
+
+    rotate = np.broadcast_to(cluster.rotate,
+                             (len(centers),) + cluster.rotate.shape).copy()
+    rotate[:, :, 1] += yaw[:, None]
+    scale = np.broadcast_to(cluster.scale,
+                            (len(centers),) + cluster.scale.shape)
+    return Placements(translate.reshape(-1, 3), rotate.reshape(-1, 3),
+                      scale.reshape(-1, 3).copy())
+
+
+def desk_rows(rows, desks_per_row, desk_spacing=160.0, row_spacing=180.0,
+              monitors_per_desk=1, monitor_width=90.0,
+              viewing_distance=120.0, desk_height=75.0, back_to_back=True,
+              origin=(0.0, 0.0, 0.0)):
+    """Open-plan desk rows with one multi-monitor setup per desk.
+
+    With back_to_back the even rows are turned around, so rows 0/1, 2/3...
+    put their monitors back to back like a bench layout.
+    """
+    cluster = multi_monitor_desk(monitors_per_desk, monitor_width,
+                                 viewing_distance)
+    centers = grid(rows, desks_per_row, (desk_spacing, row_spacing),
+                   origin).translate
+    centers[:, 1] += desk_height
+    yaw = np.zeros(len(centers))
+    if back_to_back:
+        row_index = np.repeat(np.arange(rows), desks_per_row)
+        yaw[row_index % 2 == 0] = 180.0
+    return place_clusters(cluster, centers, yaw)
+
+
+def to_specs(specs, layout):
+    """Yield every spec with the matching translate/rotate/scale attached"""
+    for spec, translate, rotate, scale in zip(specs, layout.translate.tolist(),
+                                              layout.rotate.tolist(),
+                                              layout.scale.tolist()):
+        spec = dict(spec)
+        spec.update(translate=translate, rotate=rotate, scale=scale)
+        yield spec
+
+
+def apply(nodes, layout):
+    """Set the transforms of generated or instanced monitors in one pass"""
+    from monitor_core import set_transforms
+    set_transforms(nodes, layout.translate.tolist(), layout.rotate.tolist(),
+                   layout.scale.tolist())
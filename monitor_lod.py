@@ -0,0 +1,134 @@
+"""Levels of detail per monitor and polycount budgets for large layouts.
+
+Every spec has three levels (monitor_geo.LOD_LEVELS): the full monitor, a
+simple one without the screen and back extrusions, and a single-box proxy.
+
+    lod = make_lod_group(monitor)   # one Maya lodGroup switching by distance
+    groups = make_budgeted(monitor, specs, budget=500000,
+                           camera=(0.0, 170.0, 800.0))
+
+make_budgeted() gives the monitors nearest the camera the most detail that
+still keeps the whole layout under a triangle budget, then builds each
+monitor at its level.
+"""
+import collections
+import math
+
+import monitor_geo
+from monitor_geo import LOD_LEVELS
+
+
+# camera distances at which a lodGroup moves to the next level
+LOD_DISTANCES = (500.0, 2000.0)
+
+
+def lod_triangles(params):
+    """Return the triangle count of every level of a full spec"""
+    return tuple(monitor_geo.triangle_count(monitor_geo.lod_meshes(params,
+                                                                   level))
+                 for level in range(len(LOD_LEVELS)))
+
+
+def choose_lods(distances, triangles, budget):
+    """Return (level per monitor, triangles used) under a budget.
+
+    triangles holds the per-level counts of every monitor. Everything starts
+    as a proxy; then, nearest first, monitors move up to the simple level
+    and after that to the full one while the budget allows. A nearer monitor
+    never ends up coarser than a farther one. When even the proxies exceed
+    the budget they are returned anyway.
+    """
+    coarsest = len(LOD_LEVELS) - 1
+    levels = [coarsest] * len(distances)
+    used = sum(counts[coarsest] for counts in triangles)
+    order = sorted(range(len(distances)), key=distances.__getitem__)
+    for level in range(coarsest - 1, -1, -1):
+        for index in order:
+            extra = triangles[index][level] - triangles[index][levels[index]]
+            if used + extra > budget:
+                break
+            levels[index] = level
+            used += extra
+    return levels, used
+
+
+def budget_lods(specs, budget, camera=(0.0, 0.0, 0.0), base=None):
+    """Return (level per spec, triangles used) for a layout of specs.
+
+    The distance of a spec is from camera to its translate; base holds the
+    parameters the specs override.
+    """
+    distances = []
+    triangles = []
+    counts = {}
+    for spec in specs:
+        params, placement = monitor_geo.split_spec(dict(base or {}, **spec))
+        translate = placement.get('translate', (0.0, 0.0, 0.0))
+        distances.append(math.sqrt(sum((a - b)**2
+                                       for a, b in zip(camera, translate))))
+        key = monitor_geo.spec_hash(params)
+        if key not in counts:
+            counts[key] = lod_triangles(params)
+        triangles.append(counts[key])
+    return choose_lods(distances, triangles, budget)
+
+
+def make_budgeted(monitor, specs, budget, camera=(0.0, 0.0, 0.0)):
+    """Build a layout with every monitor at its budgeted level.
+
+    Returns the monitor groups in spec order.
+    """
+    specs = list(specs)
+    levels, used = budget_lods(specs, budget, camera, monitor.get_params())
+    groups = [None] * len(specs)
+    lod_level = monitor.lod_level
+    try:
+        with monitor.shared_naming():
+            for level in range(len(LOD_LEVELS)):
+                indices = [i for i, spec_level in enumerate(levels)
+                           if spec_level == level]
+                if not indices:
+                    continue
+                monitor.lod_level = level
+                built = monitor.make_monitors([specs[i] for i in indices])
+                for index, group in zip(indices, built):
+                    groups[index] = group
+    finally:
+        monitor.lod_level = lod_level
+
+    histogram = collections.Counter(levels)
+    print(f"{used} triangles for a budget of {budget}: " + ", ".join(
+        f"{histogram[level]} {name}"
+        for level, name in enumerate(LOD_LEVELS)))
+    return groups
+
+
+def make_lod_group(monitor, distances=LOD_DISTANCES, camera="persp"):
+    """Build every level of the current spec under one Maya lodGroup.
+
+    The group shows level i + 1 once camera is farther than distances[i].
+    Returns the lodGroup node.
+    """
+    import maya.cmds as cmds
+
+    lod_level = monitor.lod_level
+    levels = []
+    try:
+        for level in range(len(LOD_LEVELS)):
+            monitor.lod_level = level
+            levels.append(monitor.make_monitor())
+    finally:
+        monitor.lod_level = lod_level
+
+    lod = cmds.createNode('lodGroup', name="monitor_lod")
+    levels = cmds.parent(levels, lod)
+    cmds.connectAttr(f"{camera}.worldMatrix[0]", f"{lod}.cameraMatrix")
+    for i, distance in enumerate(distances):
+        cmds.setAttr(f"{lod}.threshold[{i}]", distance)
+    for i, level in enumerate(levels):
+        cmds.connectAttr(f"{lod}.output[{i}]", f"{level}.visibility")
+
+    counts = lod_triangles(monitor.get_params())
+    print(f"{lod}: " + ", ".join(f"{name} {count} triangles"
+                                 for name, count in zip(LOD_LEVELS, counts)))
+    return lod
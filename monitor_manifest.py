@@ -0,0 +1,136 @@
+"""Incremental re-generation of a monitor layout from its spec file.
+
+Every monitor group placed by sync() carries its manifest entry as string
+attributes: the spec id, a hash of its full parameters and a hash of its
+placement. On the next sync the scene is read back through those attributes
+and compared with the specs, so only the changed monitors are touched:
+
+- new ids are generated
+- a changed parameter hash deletes and regenerates the monitor
+- a changed placement hash only moves the group
+- ids missing from the specs are deleted
+
+A spec is identified by its "id" value, or by its position in the spec list
+when it has none.
+"""
+import hashlib
+import time
+
+import maya.cmds as cmds
+
+from monitor_geo import PLACEMENT_KEYS, SPEC_ID_KEY, split_spec, spec_hash
+
+SPEC_ID_ATTR = 'monitorSpecId'
+PARAMS_HASH_ATTR = 'monitorParamsHash'
+PLACEMENT_HASH_ATTR = 'monitorPlacementHash'
+
+DEFAULT_PLACEMENT = {'translate': (0.0, 0.0, 0.0), 'rotate': (0.0, 0.0, 0.0),
+                     'scale': (1.0, 1.0, 1.0)}
+
+
+def placement_hash(placement):
+    """Return a stable hash of a {translate/rotate/scale: [x, y, z]} dict"""
+    key = ';'.join(
+        f"{name}=" + ','.join(f"{float(value):.6f}" for value in
+                              placement.get(name, DEFAULT_PLACEMENT[name]))
+        for name in PLACEMENT_KEYS)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def manifest_entries(specs, base_params):
+    """Yield (spec id, spec, params hash, placement hash) per spec.
+
+    The specs override base_params, like in Monitor.make_monitors.
+    """
+    for index, spec in enumerate(specs):
+        spec = dict(spec)
+        spec_id = str(spec.pop(SPEC_ID_KEY, index))
+        params, placement = split_spec(dict(base_params, **spec))
+        yield (spec_id, spec, spec_hash(params), placement_hash(placement))
+
+
+def read_manifest():
+    """Return {spec id: (group, params hash, placement hash)} of the scene"""
+    manifest = {}
+    for group in cmds.ls(f'*.{SPEC_ID_ATTR}', objectsOnly=True, long=True,
+                         recursive=True) or []:
+        manifest[cmds.getAttr(f'{group}.{SPEC_ID_ATTR}')] = (
+            group, cmds.getAttr(f'{group}.{PARAMS_HASH_ATTR}'),
+            cmds.getAttr(f'{group}.{PLACEMENT_HASH_ATTR}'))
+    return manifest
+
+
+def tag(group, spec_id, params_key, placement_key):
+    """Store the manifest entry of a monitor on its group"""
+    for attr, value in ((SPEC_ID_ATTR, spec_id),
+                        (PARAMS_HASH_ATTR, params_key),
+                        (PLACEMENT_HASH_ATTR, placement_key)):
+        if not cmds.objExists(f'{group}.{attr}'):
+            cmds.addAttr(group, longName=attr, dataType='string')
+        cmds.setAttr(f'{group}.{attr}', value, type='string')
+
+
+def sync(monitor, specs):
+    """Bring the tagged monitors of the scene in line with specs.
+
+    Returns {'created', 'regenerated', 'moved', 'deleted', 'unchanged'}
+    counts. The whole sync is one undo chunk.
+    """
+    start = time.perf_counter()
+    scene = read_manifest()
+    counts = dict.fromkeys(('created', 'regenerated', 'moved', 'deleted',
+                            'unchanged'), 0)
+    build = []
+    moves = []
+    stale = []
+    seen = set()
+    for spec_id, spec, params_key, placement_key in manifest_entries(
+            specs, monitor.get_params()):
+        if spec_id in seen:
+            raise ValueError(f"Duplicate spec id: {spec_id}")
+        seen.add(spec_id)
+        entry = scene.get(spec_id)
+        if entry is None:
+            counts['created'] += 1
+        elif entry[1] != params_key:
+            counts['regenerated'] += 1
+            stale.append(entry[0])
+        elif entry[2] != placement_key:
+            counts['moved'] += 1
+            moves.append((entry[0], spec, spec_id, params_key,
+                          placement_key))
+            continue
+        else:
+            counts['unchanged'] += 1
+            continue
+        build.append((spec, spec_id, params_key, placement_key))
+
+    removed = [group for spec_id, (group, _, _) in scene.items()
+               if spec_id not in seen]
+    counts['deleted'] = len(removed)
+
+    cmds.undoInfo(openChunk=True, chunkName="sync_monitors")
+    try:
+        if stale or removed:
+            cmds.delete(stale + removed)
+            if monitor.cache is not None:
+                monitor.cache.prune()
+        for group, spec, spec_id, params_key, placement_key in moves:
+            placement = dict(DEFAULT_PLACEMENT, **{
+                key: spec[key] for key in PLACEMENT_KEYS if key in spec})
+            cmds.xform(group, translation=placement['translate'],
+                       rotation=placement['rotate'],
+                       scale=placement['scale'])
+            tag(group, spec_id, params_key, placement_key)
+        if build:
+            groups = monitor.make_monitors([spec for spec, _, _, _ in build])
+            for group, (_, spec_id, params_key, placement_key) in zip(
+                    groups, build):
+                tag(group, spec_id, params_key, placement_key)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"Synced {len(seen)} specs in {elapsed:.3f}s: " + ", ".join(
+        f"{count} {name}" for name, count in counts.items()))
+    return counts
@@ -0,0 +1,206 @@
+"""Content-addressed on-disk cache of generated monitor meshes.
+
+    monitor.disk_cache = MeshCache('/shared/monitor_cache', max_mb=512)
+
+Entries are keyed by the monitor parameter hash plus GENERATOR_VERSION, so
+bumping the version whenever the geometry code changes orphans every old
+entry instead of serving stale shapes. Each entry holds the baked panel,
+neck and base meshes in the monitor_geo.monitor_meshes layout.
+
+File layout, native byte order (little-endian on every Maya platform):
+
+    header      magic b'MONM', format version, part count    '<4sII'
+    part table  name, y offset, point/face/connect counts    '<16sdIII'
+    data        per part: float64 points (x, y, z), int32 face counts,
+                int32 face connects, each block padded to 8 bytes
+
+Entries are memory-mapped on load. Writes go to a temporary file that is
+renamed into place, so several farm workers can share one directory and a
+reader never sees a half-written entry. Loading an entry touches its
+modification time; once the directory grows past max_mb the least recently
+used entries are evicted.
+"""
+import array
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+import monitor_geo
+
+
+# bump whenever monitor_geo or the Monitor builders change the geometry
+GENERATOR_VERSION = 1
+
+FORMAT_VERSION = 1
+MAGIC = b'MONM'
+EXTENSION = '.mesh'
+
+_HEADER = struct.Struct('<4sII')
+_PART = struct.Struct('<16sdIII')
+
+
+def _padded(size):
+    return (size + 7) & ~7
+
+
+def encode(parts):
+    """Return the bytes of an entry for [(name, MeshData, y_offset)]"""
+    chunks = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(parts))]
+    data = []
+    for name, mesh, y_offset in parts:
+        chunks.append(_PART.pack(name.encode('ascii'), y_offset,
+                                 len(mesh.points), len(mesh.face_counts),
+                                 len(mesh.face_connects)))
+        data.append(array.array('d', [value for point in mesh.points
+                                      for value in point]).tobytes())
+        for values in (mesh.face_counts, mesh.face_connects):
+            block = array.array('i', values).tobytes()
+            data.append(block + b'\0' * (_padded(len(block)) - len(block)))
+    return b''.join(chunks + data)
+
+
+def decode(buffer):
+    """Return [(name, MeshData, y_offset)] from an entry buffer"""
+    view = memoryview(buffer)
+    try:
+        magic, version, count = _HEADER.unpack_from(view)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Not a monitor mesh cache entry")
+        table = [_PART.unpack_from(view, _HEADER.size + i * _PART.size)
+                 for i in range(count)]
+        offset = _HEADER.size + count * _PART.size
+        parts = []
+        for name, y_offset, points, faces, connects in table:
+            blocks = []
+            for fmt, length in (('d', points * 3), ('i', faces),
+                                ('i', connects)):
+                size = length * struct.calcsize(fmt)
+                # released right away, or the mmap could not be closed
+                with view[offset:offset + size].cast(fmt) as block:
+                    blocks.append(block.tolist())
+                offset += _padded(size)
+            coords, face_counts, face_connects = blocks
+            points = list(zip(coords[0::3], coords[1::3], coords[2::3]))
+            parts.append((name.rstrip(b'\0').decode('ascii'),
+                          monitor_geo.MeshData(points, face_counts,
+                                               face_connects),
+                          y_offset))
+        return parts
+    finally:
+        view.release()
+
+
+class MeshCache(object):
+    def __init__(self, root, max_mb=512):
+        self.root = root
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.evicted = 0
+        # bytes on disk, scanned on the first store and estimated after
+        self._size = None
+
+    @staticmethod
+    def key(params):
+        """Return the entry key of a full {name: value} spec"""
+        text = f"{GENERATOR_VERSION}:{monitor_geo.spec_hash(params)}"
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def load(self, key):
+        """Return the cached parts of a key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as entry_file:
+                size = os.fstat(entry_file.fileno()).st_size
+                with mmap.mmap(entry_file.fileno(), 0,
+                               access=mmap.ACCESS_READ) as buffer:
+                    parts = decode(buffer)
+        except (OSError, ValueError, struct.error):
+            # missing, evicted meanwhile, or written by another version
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        self.bytes_read += size
+        return parts
+
+    def store(self, key, parts):
+        """Write an entry atomically, then evict down to max_mb if needed"""
+        data = encode(parts)
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        self.bytes_written += len(data)
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self, target=None):
+        """Remove least recently used entries until under target bytes.
+
+        target defaults to 90% of max_bytes, so a full cache does not evict
+        on every store.
+        """
+        if target is None:
+            target = int(self.max_bytes * .9)
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for path, entry_size, _ in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                self.evicted += 1
+            except OSError:
+                # another worker evicted it first, or it is open on Windows
+                pass
+            size -= entry_size
+        self._size = size
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'bytes_read': self.bytes_read,
+                'bytes_written': self.bytes_written,
+                'evicted': self.evicted}
+
+    def _entries(self):
+        """Yield (path, size, mtime) of every entry"""
+        if not os.path.isdir(self.root):
+            return
+        for directory, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                if not file_name.endswith(EXTENSION):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _path(self, key):
+        # fan out over 256 directories to keep each one small
+        return os.path.join(self.root, key[:2], key + EXTENSION)
@@ -0,0 +1,107 @@
+"""Monitor presets stored as data files.
+
+Each preset is a <slug>.json file holding its display name and a full
+{parameter: value} spec. A preset can also have a baked <slug>.mb next to
+it: the generated monitor with its history deleted. Placing a baked preset
+imports that file instead of running the procedural generation.
+
+Listing, loading and saving presets works without Maya; only baking and
+placing import maya.cmds.
+"""
+import json
+import os
+import re
+import time
+
+
+PRESETS_DIR = os.environ.get(
+    'MONITOR_PRESETS_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'presets'))
+
+
+def preset_slug(name):
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+class PresetLibrary(object):
+    def __init__(self, root=PRESETS_DIR):
+        self.root = root
+
+    def names(self):
+        """Return the display names of every preset, sorted"""
+        if not os.path.isdir(self.root):
+            return []
+        names = []
+        for file_name in os.listdir(self.root):
+            if file_name.endswith('.json'):
+                with open(os.path.join(self.root, file_name)) as preset_file:
+                    names.append(json.load(preset_file)['name'])
+        return sorted(names)
+
+    def load(self, name):
+        """Return the {parameter: value} spec of a preset"""
+        with open(self._path(name, '.json')) as preset_file:
+            return json.load(preset_file)['params']
+
+    def save(self, name, params, bake=False):
+        """Save a spec as a preset, and its baked geometry if bake is set"""
+        if not os.path.isdir(self.root):
+            os.makedirs(self.root)
+        with open(self._path(name, '.json'), 'w') as preset_file:
+            json.dump({'name': name, 'params': params}, preset_file,
+                      indent=4)
+            preset_file.write('\n')
+        if bake:
+            self.bake(name)
+        elif self.has_baked(name):
+            # the old geometry no longer matches the parameters
+            os.remove(self._path(name, '.mb'))
+
+    def has_baked(self, name):
+        return os.path.isfile(self._path(name, '.mb'))
+
+    def bake(self, name):
+        """Generate a preset once and export it without history"""
+        import maya.cmds as cmds
+        from monitor_core import Monitor
+
+        monitor = Monitor()
+        monitor.set_params(self.load(name))
+        selection = cmds.ls(selection=True)
+        group = monitor.make_monitor()
+        try:
+            cmds.delete(group, constructionHistory=True)
+            cmds.select(group, replace=True)
+            cmds.file(self._path(name, '.mb'), force=True,
+                      exportSelected=True, type='mayaBinary')
+        finally:
+            cmds.delete(group)
+            cmds.select(selection, replace=True)
+
+    def place(self, name, monitor=None):
+        """Add a preset monitor to the scene and return its group.
+
+        Baked presets are imported, the others are generated with monitor
+        (a new Monitor by default). The placement time is printed either way.
+        """
+        import maya.cmds as cmds
+        from monitor_core import Monitor
+
+        start = time.perf_counter()
+        if self.has_baked(name):
+            mode = "baked"
+            new_nodes = cmds.file(self._path(name, '.mb'), i=True,
+                                  returnNewNodes=True, namespace=':',
+                                  mergeNamespacesOnClash=True)
+            group = cmds.ls(new_nodes, assemblies=True, long=True)[0]
+        else:
+            mode = "procedural"
+            monitor = monitor or Monitor()
+            monitor.set_params(self.load(name))
+            group = monitor.make_monitor()
+        elapsed = time.perf_counter() - start
+        print(f"Placed {name} ({mode}) in {elapsed * 1000.0:.2f} ms")
+        return group
+
+    def _path(self, name, extension):
+        return os.path.join(self.root, preset_slug(name) + extension)
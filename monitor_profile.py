@@ -0,0 +1,115 @@
+"""Opt-in timing of monitor generation.
+
+    profiler = Profiler()
+    monitor.profiler = profiler
+    monitor.make_monitors(specs)
+    print(profiler.summary())
+    profiler.export_chrome_trace('monitors_trace.json')
+
+Every phase of make_monitor (panel, neck, base, group, cache) and every
+maya.cmds call made while building is recorded per monitor. With
+Monitor.profiler left at None nothing is wrapped or recorded.
+"""
+import collections
+import contextlib
+import json
+import time
+
+
+Event = collections.namedtuple('Event', 'category name monitor start duration')
+
+
+class Profiler(object):
+    def __init__(self):
+        self.events = []
+        self.monitor_index = -1
+        self._origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def monitor(self):
+        """Time one whole monitor"""
+        self.monitor_index += 1
+        with self.phase("monitor", category="monitor"):
+            yield
+
+    @contextlib.contextmanager
+    def phase(self, name, category="phase"):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append(Event(category, name, self.monitor_index,
+                                     start, time.perf_counter() - start))
+
+    @contextlib.contextmanager
+    def commands(self, module):
+        """Time every call made through module.cmds while active"""
+        cmds = module.cmds
+        if isinstance(cmds, _TimedCmds):
+            yield
+            return
+        module.cmds = _TimedCmds(cmds, self)
+        try:
+            yield
+        finally:
+            module.cmds = cmds
+
+    def durations(self):
+        """Return {(category, name): [seconds]} for every recorded event"""
+        grouped = collections.defaultdict(list)
+        for event in self.events:
+            grouped[(event.category, event.name)].append(event.duration)
+        return grouped
+
+    def summary(self):
+        """Return a plain-text table of counts and percentiles in ms"""
+        lines = [f"{'category':<8} {'name':<18} {'count':>7} {'total':>10} "
+                 f"{'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}"]
+        for (category, name), durations in sorted(self.durations().items()):
+            durations.sort()
+            lines.append(
+                f"{category:<8} {name:<18} {len(durations):>7} "
+                f"{sum(durations) * 1000.0:>10.2f} "
+                f"{percentile(durations, 50) * 1000.0:>8.3f} "
+                f"{percentile(durations, 90) * 1000.0:>8.3f} "
+                f"{percentile(durations, 99) * 1000.0:>8.3f} "
+                f"{durations[-1] * 1000.0:>8.3f}")
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path):
+        """Write the events as Chrome trace JSON (chrome://tracing)"""
+        trace_events = [{
+            'name': event.name, 'cat': event.category, 'ph': 'X',
+            'ts': (event.start - self._origin) * 1e6,
+            'dur': event.duration * 1e6,
+            'pid': 1, 'tid': 1,
+            'args': {'monitor': event.monitor},
+        } for event in self.events]
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': trace_events,
+                       'displayTimeUnit': 'ms'}, trace_file)
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+
+class _TimedCmds(object):
+    """maya.cmds proxy recording a "cmd" event per call"""
+    def __init__(self, cmds, profiler):
+        self._cmds = cmds
+        self._profiler = profiler
+
+    def __getattr__(self, command):
+        function = getattr(self._cmds, command)
+        if not callable(function):
+            return function
+
+        def timed(*args, **kwargs):
+            with self._profiler.phase(command, category="cmd"):
+                return function(*args, **kwargs)
+        return timed
@@ -0,0 +1,202 @@
+"""Viewport proxies: a whole layout drawn as one mesh of boxes.
+
+    proxy = make_proxies(monitor, specs)      # one node, one draw call
+    expand(monitor, proxy, [0, 1, 2])         # real monitors for a few specs
+    expand_selected(monitor)                  # ... or for the selected boxes
+    expand_all(monitor)                       # everything, for good
+    expand_before_render()                    # full monitors in renders only
+
+Each spec becomes the proxy box of monitor_geo.lod_meshes (level 2), moved
+by its placement, and every box goes into a single history-free mesh, the
+way a GPU cache gives the viewport one drawable instead of thousands of
+meshes with polyCube/polyExtrudeFacet history. No real monitor is built
+until it is expanded. The specs are kept as JSON on the proxy node, so the
+scene can be saved and expanded later; box i is faces 6i to 6i + 5.
+"""
+import json
+import re
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+import monitor_geo
+from monitor_export import placement_matrix
+
+
+SPECS_ATTR = 'monitorProxySpecs'
+# the single-box level of monitor_geo.lod_meshes, and its face count
+PROXY_LEVEL = len(monitor_geo.LOD_LEVELS) - 1
+BOX_FACES = 6
+PRE_RENDER_MEL = ('python("import monitor_proxy; '
+                  'monitor_proxy.expand_for_render()")')
+POST_RENDER_MEL = ('python("import monitor_proxy; '
+                   'monitor_proxy.restore_after_render()")')
+
+# what the current render expanded, for restore_after_render()
+_render_groups = []
+_hidden_proxies = []
+
+
+def proxy_mesh(specs, base=None):
+    """Return the MeshData of one placed proxy box per spec"""
+    points, face_counts, face_connects = [], [], []
+    boxes = {}
+    for spec in specs:
+        params, placement = monitor_geo.split_spec(dict(base or {}, **spec))
+        key = monitor_geo.spec_hash(params)
+        if key not in boxes:
+            boxes[key] = monitor_geo.combine(
+                monitor_geo.lod_meshes(params, PROXY_LEVEL))
+        box = boxes[key]
+        matrix = placement_matrix(placement)
+        start = len(points)
+        points.extend(tuple(row[0]*x + row[1]*y + row[2]*z + row[3]
+                            for row in matrix)
+                      for x, y, z in box.points)
+        face_counts.extend(box.face_counts)
+        face_connects.extend(start + i for i in box.face_connects)
+    return monitor_geo.MeshData(points, face_counts, face_connects)
+
+
+def make_proxies(monitor, specs, name="monitor_proxies"):
+    """Add a single proxy mesh for every spec, return its transform.
+
+    The specs override the current parameters of monitor, like in
+    Monitor.make_monitors. The mesh is made with MFnMesh.create, which
+    cannot be undone: delete the proxy instead.
+    """
+    specs = [dict(spec) for spec in specs]
+    base = monitor.get_params()
+    mesh = proxy_mesh(specs, base)
+    fn_mesh = om.MFnMesh()
+    transform = fn_mesh.create([om.MPoint(*point) for point in mesh.points],
+                               mesh.face_counts, mesh.face_connects)
+    fn_mesh.setName(f"{name}Shape")
+    fn_transform = om.MFnTransform(transform)
+    fn_transform.setName(name)
+    proxy = fn_transform.partialPathName()
+    cmds.sets(fn_mesh.fullPathName(), edit=True,
+              forceElement="initialShadingGroup")
+    # the specs are stored fully resolved, so expanding them later does not
+    # depend on the parameters the expanding Monitor happens to have
+    cmds.addAttr(proxy, longName=SPECS_ATTR, dataType='string')
+    cmds.setAttr(f'{proxy}.{SPECS_ATTR}',
+                 json.dumps([dict(base, **spec) for spec in specs]),
+                 type='string')
+    return proxy
+
+
+def proxy_specs(proxy):
+    return json.loads(cmds.getAttr(f'{proxy}.{SPECS_ATTR}'))
+
+
+def list_proxies():
+    return cmds.ls(f'*.{SPECS_ATTR}', objectsOnly=True, recursive=True) or []
+
+
+def expand(monitor, proxy, indices=None):
+    """Build the real monitors of some proxy boxes, all by default.
+
+    The expanded boxes are deleted from the proxy, or the whole proxy once
+    none is left, with undoable commands, so the expansion undoes in one
+    step as long as monitor.undoable. Returns the new monitor groups.
+    """
+    specs = proxy_specs(proxy)
+    if indices is None:
+        indices = range(len(specs))
+    indices = sorted(set(indices))
+    expanded = set(indices)
+    remaining = [spec for i, spec in enumerate(specs) if i not in expanded]
+
+    cmds.undoInfo(openChunk=True, chunkName="expand_proxies")
+    try:
+        groups = monitor.make_monitors([specs[i] for i in indices])
+        if remaining:
+            # the boxes left keep their order, box i is faces 6i to 6i + 5
+            cmds.delete([f'{proxy}.f[{i * BOX_FACES}:'
+                         f'{(i + 1) * BOX_FACES - 1}]' for i in indices])
+            cmds.setAttr(f'{proxy}.{SPECS_ATTR}', json.dumps(remaining),
+                         type='string')
+        else:
+            cmds.delete(proxy)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return groups
+
+
+def expand_selected(monitor):
+    """Expand the proxy boxes with a selected face"""
+    selected = {}
+    for component in cmds.ls(selection=True, flatten=True) or []:
+        match = re.match(r'(.+)\.f\[(\d+)\]$', component)
+        if not match:
+            continue
+        node, face = match.groups()
+        if cmds.objectType(node) == 'mesh':
+            node = cmds.listRelatives(node, parent=True, fullPath=True)[0]
+        if cmds.objExists(f'{node}.{SPECS_ATTR}'):
+            selected.setdefault(node, set()).add(int(face) // BOX_FACES)
+    groups = []
+    with monitor.shared_naming():
+        for proxy, indices in selected.items():
+            groups.extend(expand(monitor, proxy, indices))
+    return groups
+
+
+def expand_all(monitor=None):
+    """Expand every proxy of the scene for good"""
+    from monitor_core import Monitor
+
+    monitor = monitor or Monitor()
+    groups = []
+    with monitor.shared_naming():
+        for proxy in list_proxies():
+            groups.extend(expand(monitor, proxy))
+    return groups
+
+
+def expand_for_render(monitor=None):
+    """Build the real monitors of every proxy and hide the proxies.
+
+    Unlike expand_all() the proxies are kept; restore_after_render() deletes
+    the monitors again and shows them.
+    """
+    from monitor_core import Monitor
+
+    monitor = monitor or Monitor()
+    restore_after_render()
+    with monitor.shared_naming():
+        for proxy in list_proxies():
+            _render_groups.extend(monitor.make_monitors(proxy_specs(proxy),
+                                                        quiet=True))
+            cmds.setAttr(f'{proxy}.visibility', False)
+            _hidden_proxies.append(proxy)
+
+
+def restore_after_render():
+    """Undo expand_for_render(): delete its monitors, show the proxies"""
+    groups = [group for group in _render_groups if cmds.objExists(group)]
+    if groups:
+        cmds.delete(groups)
+    for proxy in _hidden_proxies:
+        if cmds.objExists(proxy):
+            cmds.setAttr(f'{proxy}.visibility', True)
+    del _render_groups[:]
+    del _hidden_proxies[:]
+
+
+def expand_before_render(enabled=True):
+    """Render full monitors in place of the proxies, or stop doing so.
+
+    The pre render MEL expands every proxy for the render only and the post
+    render MEL restores them. Any other pre or post render script is kept.
+    """
+    for attr, command in (('preMel', PRE_RENDER_MEL),
+                          ('postMel', POST_RENDER_MEL)):
+        plug = f'defaultRenderGlobals.{attr}'
+        script = (cmds.getAttr(plug) or '').replace(f'{command};', '')
+        if enabled:
+            if script.strip() and not script.rstrip().endswith(';'):
+                script += ';'
+            script += f'{command};'
+        cmds.setAttr(plug, script, type='string')
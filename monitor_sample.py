@@ -0,0 +1,113 @@
+"""Seeded variation of monitor specs around a preset.
+
+    python monitor_sample.py "Flat-Panel Display" -n 5000 --seed 7 \\
+        --vary width=0.15:5 height=0.1:3 -o specs.jsonl
+
+Every varied parameter is drawn around its preset value, then snapped to one
+of a fixed number of buckets spread over the allowed range. The batch can
+therefore hold at most the product of the bucket counts as distinct shapes,
+which keeps GeometryCache and the exporters reusing meshes. The same seed
+always gives the same specs.
+"""
+import argparse
+import collections
+import json
+import random
+
+import monitor_geo
+from monitor_presets import PresetLibrary
+
+
+# spread is the +/- fraction of the base value the parameter may move
+Variation = collections.namedtuple('Variation',
+                                   'spread buckets distribution')
+
+DISTRIBUTIONS = ("uniform", "normal")
+
+
+def variation(spread, buckets, distribution="uniform"):
+    spread, buckets = float(spread), int(buckets)
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    if buckets < 1:
+        raise ValueError("A variation needs at least one bucket")
+    return Variation(spread, buckets, distribution)
+
+
+def bucket_values(base, var):
+    """Return the values a parameter can be snapped to"""
+    low, high = base * (1.0 - var.spread), base * (1.0 + var.spread)
+    if var.buckets == 1:
+        return [base]
+    step = (high - low) / (var.buckets - 1)
+    return [round(low + i*step, 6) for i in range(var.buckets)]
+
+
+def sample_specs(base, count, variations, seed=0):
+    """Return count specs varying base by {parameter: Variation}.
+
+    uniform draws across the whole spread, normal uses a standard deviation
+    of half the spread and clips to it.
+    """
+    rng = random.Random(seed)
+    buckets = {name: bucket_values(base[name], var)
+               for name, var in variations.items()}
+    # sorted so the draw order, hence the result, never depends on dict order
+    names = sorted(variations)
+
+    specs = []
+    for _ in range(count):
+        spec = dict(base)
+        for name in names:
+            var = variations[name]
+            if var.distribution == "normal":
+                offset = max(-1.0, min(1.0, rng.gauss(0.0, .5)))
+            else:
+                offset = rng.uniform(-1.0, 1.0)
+            values = buckets[name]
+            index = min(len(values) - 1,
+                        int((offset + 1.0) * .5 * len(values)))
+            spec[name] = values[index]
+        specs.append(spec)
+    return specs
+
+
+def unique_shapes(specs):
+    """Return how many distinct monitor shapes the specs hold"""
+    return len({monitor_geo.spec_hash(monitor_geo.full_params(spec))
+                for spec in specs})
+
+
+def parse_variation(text):
+    """Parse name=spread:buckets[:distribution] into (name, Variation)"""
+    name, _, value = text.partition('=')
+    fields = value.split(':')
+    if name not in monitor_geo.MONITOR_PARAMS or len(fields) not in (2, 3):
+        raise argparse.ArgumentTypeError(
+                    f"Expected name=spread:buckets[:distribution], got {text}")
+    return name, variation(*fields[:2], *fields[2:])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('preset', help="base preset name")
+    parser.add_argument('-n', '--count', type=int, required=True)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--vary', type=parse_variation, nargs='+',
+                        required=True,
+                        help="name=spread:buckets[:uniform|normal]")
+    parser.add_argument('-o', '--output', required=True,
+                        help="JSONL spec file to write")
+    args = parser.parse_args(argv)
+
+    base = PresetLibrary().load(args.preset)
+    specs = sample_specs(base, args.count, dict(args.vary), args.seed)
+    with open(args.output, 'w') as spec_file:
+        for spec in specs:
+            spec_file.write(json.dumps(spec) + '\n')
+    print(f"Sampled {len(specs)} specs with {unique_shapes(specs)} unique "
+          f"shapes to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Build a batch of monitors a chunk at a time from an event loop.
+
+    batch = ChunkedGeneration(monitor, specs)
+    batch.start()
+    while batch.step():     # the dialog calls step() from a QTimer instead
+        print(batch.status())
+
+Each step builds one Monitor.make_monitors chunk and sizes the next one from
+the measured time per monitor, so a step stays under frame_budget seconds
+and the UI keeps redrawing between them. Every chunk is its own undo chunk,
+so edits made in Maya while the batch runs stay out of it; cancel() deletes
+every monitor built so far in one undoable step.
+"""
+import time
+
+import maya.cmds as cmds
+
+from monitor_core import NameAllocator
+
+
+# 30 fps: the longest a chunk may block the Maya main thread
+FRAME_BUDGET = 1.0 / 30.0
+
+
+class ChunkedGeneration(object):
+    def __init__(self, monitor, specs, frame_budget=FRAME_BUDGET,
+                 max_chunk=1000):
+        self.monitor = monitor
+        self.specs = list(specs)
+        self.frame_budget = frame_budget
+        self.max_chunk = max_chunk
+        # the first chunk measures the cost of a single monitor
+        self.chunk_size = 1
+        self.chunks = 0
+        self.groups = []
+        self.running = False
+        self.cancelled = False
+        # the exception that ended the batch, if any
+        self.error = None
+        self._start = None
+        self._naming = None
+
+    @property
+    def total(self):
+        return len(self.specs)
+
+    @property
+    def built(self):
+        return len(self.groups)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start if self._start else 0.0
+
+    @property
+    def rate(self):
+        """Monitors per second so far"""
+        elapsed = self.elapsed
+        return self.built / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self):
+        """Estimated seconds left, None until the rate is known"""
+        rate = self.rate
+        if not rate:
+            return None
+        return (self.total - self.built) / rate
+
+    def start(self):
+        self._naming = self.monitor.naming
+        # one prefix for the whole batch instead of one per chunk
+        if self._naming is None:
+            self.monitor.naming = NameAllocator()
+        self._start = time.perf_counter()
+        self.running = True
+
+    def step(self):
+        """Build the next chunk, return False once the batch is over.
+
+        A chunk that raises cancels the batch and is kept in error, so an
+        event loop calling step() does not hit the same error again.
+        """
+        if not self.running:
+            return False
+        if not self.total:
+            self._stop()
+            return False
+        chunk = self.specs[self.built:self.built + self.chunk_size]
+        start = time.perf_counter()
+        try:
+            self.groups.extend(self.monitor.make_monitors(chunk, quiet=True))
+        except Exception as error:
+            self.error = error
+            print(f"Batch failed on a chunk of {len(chunk)} specs: "
+                  f"{error!r}")
+            self.cancel()
+            return False
+        per_monitor = (time.perf_counter() - start) / len(chunk)
+        self.chunks += 1
+
+        # at most double per step, a single fast chunk can be misleading
+        fitting = (int(self.frame_budget / per_monitor) if per_monitor
+                   else self.max_chunk)
+        self.chunk_size = max(1, min(fitting, self.chunk_size * 2,
+                                     self.max_chunk))
+        if self.built >= self.total:
+            self._stop()
+            print(f"Generated {self.built} monitors in {self.elapsed:.3f}s "
+                  f"({self.rate:.1f} monitors/sec, {self.chunks} chunks)")
+            return False
+        return True
+
+    def cancel(self):
+        """Stop and delete everything built so far in one step"""
+        if not self.running:
+            return
+        self._stop()
+        # the user may have deleted some of them meanwhile
+        groups = [group for group in self.groups if cmds.objExists(group)]
+        if groups:
+            cmds.delete(groups)
+        self.cancelled = True
+        print(f"Cancelled after {self.built} of {self.total} monitors, "
+              f"deleted them")
+        self.groups = []
+
+    def status(self):
+        eta = self.eta
+        eta_text = "--" if eta is None else f"{eta:.1f}s"
+        return (f"{self.built}/{self.total} monitors, "
+                f"{self.rate:.1f} monitors/sec, ETA {eta_text}")
+
+    def _stop(self):
+        self.running = False
+        self.monitor.naming = self._naming
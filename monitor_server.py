@@ -0,0 +1,454 @@
+"""Local job server keeping warm generator sessions between jobs.
+
+    python monitor_server.py serve --sessions 2 --port 8765
+    python monitor_server.py submit specs.jsonl --url http://127.0.0.1:8765
+    python monitor_server.py bench specs.jsonl --backend export
+
+A one-shot monitor_cli run pays mayapy startup and maya.standalone
+initialization before its first monitor. Here each session is a worker
+process started once, that initializes its backend and then runs job after
+job. The server queues jobs posted over localhost HTTP and hands each one to
+the next idle session:
+
+    POST /jobs          {"specs": [...], "extension": ".mb"}  -> {"id": ...}
+    GET  /jobs/<id>     status, output path and timings of a job
+    GET  /status        sessions, queue length and latency figures
+
+The "maya" backend builds the specs with monitor_cli.generate under mayapy;
+the "export" backend writes them with monitor_export under plain Python, a
+stand-in to exercise the server without Maya.
+"""
+import argparse
+import http.server
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+import monitor_cli
+
+
+DEFAULT_PORT = 8765
+
+
+class MayaBackend(object):
+    extension = '.mb'
+    needs_mayapy = True
+
+    def __init__(self, disk_cache=None):
+        self.disk_cache = disk_cache
+
+    def start(self):
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+        # load the generator now rather than in the first job
+        import monitor_core
+        monitor_core.Monitor()
+
+    def run(self, spec_path, output):
+        return monitor_cli.generate(spec_path, output,
+                                    disk_cache=self.disk_cache)
+
+
+class ExportBackend(object):
+    extension = '.obj'
+    needs_mayapy = False
+
+    def __init__(self, disk_cache=None):
+        self.export = None
+
+    def start(self):
+        import monitor_export
+        self.export = monitor_export.export
+
+    def run(self, spec_path, output):
+        return self.export(monitor_cli.iter_specs(spec_path), output)
+
+
+BACKENDS = {'maya': MayaBackend, 'export': ExportBackend}
+
+
+def worker_main(backend_name, disk_cache=None):
+    """Run jobs read as JSON lines from stdin, answer on stdout.
+
+    Everything the backend prints goes to stderr, stdout only carries the
+    protocol: a "ready" line once started, then one result line per job.
+    """
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    start = time.perf_counter()
+    backend = BACKENDS[backend_name](disk_cache)
+    backend.start()
+    _send(protocol, {'ready': time.perf_counter() - start})
+
+    for line in sys.stdin:
+        job = json.loads(line)
+        start = time.perf_counter()
+        try:
+            count = backend.run(job['specs_path'], job['output'])
+        except Exception as error:
+            _send(protocol, {'id': job['id'], 'error': repr(error)})
+            continue
+        _send(protocol, {'id': job['id'], 'output': job['output'],
+                         'count': count,
+                         'seconds': time.perf_counter() - start})
+
+
+def _send(stream, message):
+    stream.write(json.dumps(message) + '\n')
+    stream.flush()
+
+
+class Session(object):
+    """One warm worker process"""
+    def __init__(self, backend, mayapy=None, disk_cache=None):
+        self.backend = backend
+        self.mayapy = mayapy or os.environ.get('MAYAPY', 'mayapy')
+        self.disk_cache = disk_cache
+        self.process = None
+        self.startup_seconds = None
+        self.jobs_run = 0
+
+    def start(self):
+        executable = (self.mayapy if BACKENDS[self.backend].needs_mayapy
+                      else sys.executable)
+        cmd = [executable, os.path.abspath(__file__), 'worker',
+               '--backend', self.backend]
+        if self.disk_cache:
+            cmd += ['--disk-cache', self.disk_cache]
+        start = time.perf_counter()
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        universal_newlines=True, bufsize=1)
+        self._receive()
+        self.startup_seconds = time.perf_counter() - start
+        self.jobs_run = 0
+
+    def run(self, job_id, specs_path, output):
+        """Run one job, return the worker's result message"""
+        _send(self.process.stdin, {'id': job_id, 'specs_path': specs_path,
+                                   'output': output})
+        self.jobs_run += 1
+        return self._receive()
+
+    def close(self):
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process = None
+
+    def _receive(self):
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"{self.backend} session exited with "
+                               f"{self.process.wait()}")
+        return json.loads(line)
+
+
+class JobServer(object):
+    def __init__(self, backend="maya", sessions=1, host='127.0.0.1',
+                 port=DEFAULT_PORT, workdir=None, mayapy=None,
+                 disk_cache=None):
+        self.backend = backend
+        self.workdir = workdir or tempfile.mkdtemp(prefix='monitor_jobs_')
+        os.makedirs(self.workdir, exist_ok=True)
+        self.sessions = [Session(backend, mayapy, disk_cache)
+                         for _ in range(sessions)]
+        self.jobs = {}
+        self.queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._dispatchers = []
+        self.httpd = http.server.ThreadingHTTPServer((host, port),
+                                                     _make_handler(self))
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start the sessions, then serve HTTP from a background thread"""
+        for session in self.sessions:
+            session.start()
+            print(f"{self.backend} session ready in "
+                  f"{session.startup_seconds:.3f}s")
+        for session in self.sessions:
+            dispatcher = threading.Thread(target=self._dispatch,
+                                          args=(session,), daemon=True)
+            dispatcher.start()
+            self._dispatchers.append(dispatcher)
+        threading.Thread(target=self.httpd.serve_forever,
+                         daemon=True).start()
+        print(f"Serving {self.backend} jobs on {self.url}")
+
+    def stop(self):
+        """Stop taking jobs, finish the queued ones, then end the sessions"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        for _ in self._dispatchers:
+            self.queue.put(None)
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+        for session in self.sessions:
+            session.close()
+
+    def submit(self, specs, extension=None):
+        """Queue a batch of specs, return its job id"""
+        # unique even when a restarted server reuses the workdir
+        job_dir = tempfile.mkdtemp(prefix='job_', dir=self.workdir)
+        job_id = os.path.basename(job_dir)
+        specs_path = os.path.join(job_dir, 'specs.jsonl')
+        with open(specs_path, 'w') as specs_file:
+            for spec in specs:
+                specs_file.write(json.dumps(spec) + '\n')
+        extension = extension or BACKENDS[self.backend].extension
+        with self._lock:
+            self.jobs[job_id] = {
+                'id': job_id, 'status': 'queued', 'specs_path': specs_path,
+                'output': os.path.join(job_dir, 'monitors' + extension),
+                'submitted': time.time()}
+        self.queue.put(job_id)
+        return job_id
+
+    def job(self, job_id):
+        """Return a copy of a job record, or None for an unknown id"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return None if job is None else dict(job)
+
+    def status(self):
+        with self._lock:
+            done = [dict(job) for job in self.jobs.values()
+                    if job['status'] == 'done']
+        latency = {}
+        for kind in ('cold', 'warm'):
+            seconds = [job['latency'] for job in done
+                       if job['cold'] == (kind == 'cold')]
+            if seconds:
+                latency[kind] = sum(seconds) / len(seconds)
+        return {'backend': self.backend,
+                'sessions': [{'startup_seconds': session.startup_seconds,
+                              'jobs_run': session.jobs_run}
+                             for session in self.sessions],
+                'queued': self.queue.qsize(), 'done': len(done),
+                'mean_latency': latency}
+
+    def _dispatch(self, session):
+        while True:
+            job_id = self.queue.get()
+            if job_id is None:
+                return
+            with self._lock:
+                job = self.jobs[job_id]
+                # the first job of a session still pays its lazy imports;
+                # the session startup itself is in status()
+                job.update(status='running', started=time.time(),
+                           cold=session.jobs_run == 0)
+            failed = False
+            try:
+                if session.process is None:
+                    # the last restart failed, try again for this job
+                    session.start()
+                result = session.run(job_id, job['specs_path'],
+                                     job['output'])
+            except (OSError, RuntimeError, ValueError) as error:
+                result = {'error': repr(error)}
+                failed = True
+            finished = time.time()
+            with self._lock:
+                job.update(finished=finished,
+                           latency=finished - job['submitted'])
+                if 'error' in result:
+                    job.update(status='failed', error=result['error'])
+                else:
+                    job.update(status='done', count=result['count'],
+                               run_seconds=result['seconds'])
+            if failed:
+                # the worker died, replace it for the next job
+                self._restart(session)
+
+    def _restart(self, session):
+        try:
+            session.close()
+        except OSError:
+            session.process = None
+        try:
+            session.start()
+        except (OSError, RuntimeError, ValueError) as error:
+            print(f"Could not restart the {self.backend} session: {error!r}")
+            session.process = None
+
+
+def _make_handler(server):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            job = None
+            if self.path.startswith('/jobs/'):
+                job = server.job(self.path[len('/jobs/'):])
+            if self.path == '/status':
+                self._reply(200, server.status())
+            elif job is not None:
+                self._reply(200, job)
+            else:
+                self._reply(404, {'error': f"Unknown path {self.path}"})
+
+        def do_POST(self):
+            if self.path != '/jobs':
+                self._reply(404, {'error': f"Unknown path {self.path}"})
+                return
+            length = int(self.headers.get('Content-Length', 0))
+            try:
+                body = json.loads(self.rfile.read(length))
+                job_id = server.submit(body['specs'], body.get('extension'))
+            except (ValueError, KeyError, TypeError) as error:
+                self._reply(400, {'error': repr(error)})
+                return
+            except OSError as error:
+                self._reply(500, {'error': repr(error)})
+                return
+            self._reply(202, {'id': job_id, 'status': 'queued'})
+
+        def _reply(self, code, message):
+            data = json.dumps(message).encode('utf-8')
+            self.send_response(code)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+def submit(url, specs, extension=None):
+    """Post a batch of specs to a server, return the job id"""
+    body = json.dumps({'specs': list(specs),
+                       'extension': extension}).encode('utf-8')
+    request = urllib.request.Request(
+        f"{url}/jobs", data=body,
+        headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())['id']
+
+
+def job_status(url, job_id):
+    with urllib.request.urlopen(f"{url}/jobs/{job_id}") as response:
+        return json.loads(response.read())
+
+
+def wait(url, job_id, poll=0.01, timeout=None):
+    """Poll a job until it is done or failed, return its status"""
+    start = time.perf_counter()
+    while True:
+        job = job_status(url, job_id)
+        if job['status'] in ('done', 'failed'):
+            return job
+        if timeout is not None and time.perf_counter() - start > timeout:
+            raise TimeoutError(f"Job {job_id} still {job['status']}")
+        time.sleep(poll)
+
+
+def bench_latency(spec_path, backend="export", jobs=5, mayapy=None):
+    """Print the latency of one-shot sessions against a warm server.
+
+    Cold runs start a fresh session per job, like running monitor_cli once
+    per batch; warm runs go through a JobServer whose session is already up.
+    """
+    specs = list(monitor_cli.iter_specs(spec_path))
+    extension = BACKENDS[backend].extension
+    workdir = tempfile.mkdtemp(prefix='monitor_bench_')
+
+    cold = []
+    for i in range(jobs):
+        start = time.perf_counter()
+        session = Session(backend, mayapy)
+        session.start()
+        session.run(str(i), os.path.abspath(spec_path),
+                    os.path.join(workdir, f"cold_{i}{extension}"))
+        session.close()
+        cold.append(time.perf_counter() - start)
+
+    server = JobServer(backend, port=0, workdir=workdir, mayapy=mayapy)
+    server.start()
+    warm = []
+    try:
+        for _ in range(jobs):
+            start = time.perf_counter()
+            job = wait(server.url, submit(server.url, specs))
+            if job['status'] != 'done':
+                raise RuntimeError(job['error'])
+            warm.append(time.perf_counter() - start)
+    finally:
+        server.stop()
+
+    print(f"{len(specs)} specs, {backend} backend, {jobs} jobs each")
+    for kind, seconds in (('cold', cold), ('warm', warm)):
+        print(f"{kind}: mean {sum(seconds) / len(seconds) * 1000.0:.1f} ms, "
+              f"min {min(seconds) * 1000.0:.1f} ms")
+    return cold, warm
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help="run the job server")
+    serve.add_argument('--backend', choices=sorted(BACKENDS), default='maya')
+    serve.add_argument('--sessions', type=int, default=1)
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT)
+    serve.add_argument('--workdir', help="where job outputs are written")
+    serve.add_argument('--mayapy', help="mayapy executable, "
+                       "defaults to $MAYAPY or mayapy on the PATH")
+    serve.add_argument('--disk-cache', metavar='DIR',
+                       help="mesh cache directory for the maya sessions")
+
+    send = commands.add_parser('submit', help="send a spec file as a job")
+    send.add_argument('specs', help="CSV or JSONL file of monitor specs")
+    send.add_argument('--url', default=f"http://127.0.0.1:{DEFAULT_PORT}")
+    send.add_argument('--extension', help="output type, e.g. .ma or .glb")
+
+    bench = commands.add_parser('bench', help="compare cold and warm jobs")
+    bench.add_argument('specs', help="CSV or JSONL file of monitor specs")
+    bench.add_argument('--backend', choices=sorted(BACKENDS),
+                       default='export')
+    bench.add_argument('--jobs', type=int, default=5)
+    bench.add_argument('--mayapy')
+
+    worker = commands.add_parser('worker', help=argparse.SUPPRESS)
+    worker.add_argument('--backend', choices=sorted(BACKENDS))
+    worker.add_argument('--disk-cache')
+    args = parser.parse_args(argv)
+
+    if args.command == 'worker':
+        worker_main(args.backend, args.disk_cache)
+    elif args.command == 'serve':
+        server = JobServer(args.backend, args.sessions, port=args.port,
+                           workdir=args.workdir, mayapy=args.mayapy,
+                           disk_cache=args.disk_cache)
+        server.start()
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            server.stop()
+    elif args.command == 'submit':
+        start = time.perf_counter()
+        job = wait(args.url, submit(args.url,
+                                    monitor_cli.iter_specs(args.specs),
+                                    args.extension))
+        print(json.dumps(job, indent=4))
+        print(f"Latency: {time.perf_counter() - start:.3f}s")
+    elif args.command == 'bench':
+        bench_latency(args.specs, args.backend, args.jobs, args.mayapy)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
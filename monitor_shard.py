@@ -0,0 +1,115 @@
+"""Generate monitors in parallel mayapy workers and merge the results.
+
+    python monitor_shard.py specs.jsonl -o shards --workers 8
+
+Spec i always lands in shard i % shard_count, so the same file and shard
+count give the same shards. Every shard is built by its own mayapy process
+into its own scene; merge_shards then references or imports those scenes
+into the current one under a per-shard namespace, so node names never
+collide across shards.
+"""
+import argparse
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import time
+
+import monitor_cli
+
+
+def write_shards(spec_path, output_dir, shard_count):
+    """Split a spec file round-robin into JSONL shards, return their paths"""
+    paths = [os.path.join(output_dir, f"shard_{i:03d}.jsonl")
+             for i in range(shard_count)]
+    shard_files = [open(path, 'w') for path in paths]
+    try:
+        for i, spec in enumerate(monitor_cli.iter_specs(spec_path)):
+            shard_files[i % shard_count].write(json.dumps(spec) + '\n')
+    finally:
+        for shard_file in shard_files:
+            shard_file.close()
+    return paths
+
+
+def build_shard(shard_path, scene_path, mayapy, extra_args=()):
+    """Run monitor_cli on one shard in a fresh mayapy process"""
+    cli = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       'monitor_cli.py')
+    cmd = [mayapy, cli, shard_path, '-o', scene_path] + list(extra_args)
+    result = subprocess.run(cmd, stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, universal_newlines=True)
+    if result.returncode:
+        raise RuntimeError(f"Shard {shard_path} failed:\n{result.stdout}")
+    return scene_path
+
+
+def run_shards(spec_path, output_dir, workers=4, shard_count=None,
+               mayapy=None, extension='.mb', extra_args=()):
+    """Build every shard of a spec file, return the shard scene paths"""
+    shard_count = shard_count or workers
+    mayapy = mayapy or os.environ.get('MAYAPY', 'mayapy')
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    start = time.perf_counter()
+    shard_paths = write_shards(spec_path, output_dir, shard_count)
+    scene_paths = [os.path.splitext(path)[0] + extension
+                   for path in shard_paths]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        jobs = [pool.submit(build_shard, shard_path, scene_path, mayapy,
+                            extra_args)
+                for shard_path, scene_path in zip(shard_paths, scene_paths)]
+        for job in jobs:
+            job.result()
+    print(f"Built {shard_count} shards with {workers} workers in "
+          f"{time.perf_counter() - start:.3f}s")
+    return scene_paths
+
+
+def merge_shards(scene_paths, reference=True):
+    """Reference (or import) shard scenes into the open scene.
+
+    Each shard gets its own namespace, shard000, shard001..., which keeps
+    node names unique whatever the shards contain.
+    """
+    import maya.cmds as cmds
+
+    namespaces = []
+    for i, path in enumerate(scene_paths):
+        namespace = f"shard{i:03d}"
+        if reference:
+            cmds.file(path, reference=True, namespace=namespace)
+        else:
+            cmds.file(path, i=True, namespace=namespace)
+        namespaces.append(namespace)
+    return namespaces
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('specs', help="CSV or JSONL file of monitor specs")
+    parser.add_argument('-o', '--output-dir', required=True)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--shards', type=int,
+                        help="number of shards, defaults to --workers")
+    parser.add_argument('--mayapy', help="mayapy executable, "
+                        "defaults to $MAYAPY or mayapy on the PATH")
+    parser.add_argument('--backend', choices=("cmds", "api"), default="cmds")
+    parser.add_argument('--disk-cache', metavar='DIR',
+                        help="mesh cache directory shared by every worker")
+    args = parser.parse_args(argv)
+
+    extra_args = ['--backend', args.backend]
+    if args.disk_cache:
+        extra_args += ['--disk-cache', os.path.abspath(args.disk_cache)]
+    scene_paths = run_shards(args.specs, args.output_dir,
+                             workers=args.workers, shard_count=args.shards,
+                             mayapy=args.mayapy, extra_args=extra_args)
+    for path in scene_paths:
+        print(path)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
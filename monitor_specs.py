@@ -0,0 +1,119 @@
+"""Columnar storage for large batches of monitor specs.
+
+A SpecArray keeps a whole batch in one NumPy structured array: the monitor
+parameters as float64 plus a float64 translate/rotate/scale placement,
+SpecArray.itemsize (208) bytes per spec. The same spec as a Python dict of
+floats costs about 1.6 KB, and a Monitor object more than that.
+
+Derived dimensions (panel_height, neck_width, base_depth...) and the
+y_offset1/2/3 stack heights are computed for the whole batch at once, and
+iter_specs() feeds Monitor.make_monitors one short-lived dict at a time.
+"""
+import numpy as np
+
+import monitor_geo
+from monitor_geo import MONITOR_PARAMS, PLACEMENT_KEYS, SPEC_ID_KEY
+
+
+SPEC_DTYPE = np.dtype([(name, np.float64) for name in MONITOR_PARAMS] +
+                      [(key, np.float64, 3) for key in PLACEMENT_KEYS])
+
+
+class SpecArray(object):
+    itemsize = SPEC_DTYPE.itemsize
+
+    def __init__(self, data):
+        self.data = data
+
+    @classmethod
+    def empty(cls, count, base=None):
+        """Return count specs set to the defaults overridden by base"""
+        data = np.zeros(count, dtype=SPEC_DTYPE)
+        for name, value in monitor_geo.full_params(base or {}).items():
+            data[name] = value
+        data['scale'] = 1.0
+        return cls(data)
+
+    @classmethod
+    def from_specs(cls, specs, count=None, base=None):
+        """Fill a SpecArray from {name: value} specs.
+
+        With count given the specs are streamed straight into a preallocated
+        array, otherwise they are read into a list first.
+        """
+        if count is None:
+            specs = list(specs)
+            count = len(specs)
+        array = cls.empty(count, base)
+        data = array.data
+        filled = 0
+        for i, spec in enumerate(specs):
+            if i >= count:
+                raise ValueError(f"More than {count} specs")
+            for name, value in spec.items():
+                if name == SPEC_ID_KEY:
+                    continue
+                if name not in SPEC_DTYPE.names:
+                    raise ValueError(f"Unknown monitor parameter: {name}")
+                data[name][i] = value
+            filled += 1
+        if filled < count:
+            return cls(data[:filled])
+        return array
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.spec(index)
+        return SpecArray(self.data[index])
+
+    def spec(self, index):
+        """Return one spec as a {name: value} dict"""
+        row = self.data[index]
+        spec = {name: float(row[name]) for name in MONITOR_PARAMS}
+        for key in PLACEMENT_KEYS:
+            spec[key] = row[key].tolist()
+        return spec
+
+    def iter_specs(self, placement=True):
+        """Yield the specs one at a time, for Monitor.make_monitors.
+
+        Columns are converted to Python lists once per batch, so no NumPy
+        scalar is touched per spec.
+        """
+        names = MONITOR_PARAMS + (PLACEMENT_KEYS if placement else ())
+        columns = [self.data[name].tolist() for name in names]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+    def derived(self):
+        """Return {name: array} of the dimensions Monitor derives"""
+        data = self.data
+        height = data['height']
+        base_height = height * data['base_height_ratio']
+        neck_height = height * data['neck_height_ratio']
+        panel_height = height * data['panel_height_ratio']
+        return {
+            'panel_height': panel_height,
+            'panel_depth': data['depth'] * data['panel_depth_ratio'],
+            'neck_width': data['width'] * data['neck_width_ratio'],
+            'neck_height': neck_height,
+            'neck_depth': data['depth'] * data['neck_depth_ratio'],
+            'base_width': data['width'] * data['base_width_ratio'],
+            'base_height': base_height,
+            'base_depth': data['depth'] * data['base_depth_ratio'],
+            'y_offset1': base_height * .5,
+            'y_offset2': neck_height * .5 + base_height,
+            'y_offset3': panel_height * .5 + base_height + neck_height,
+        }
+
+    def set_layout(self, layout):
+        """Copy a monitor_layout.Placements into the placement columns"""
+        for key, values in zip(PLACEMENT_KEYS, layout):
+            self.data[key] = values
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
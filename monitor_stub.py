@@ -0,0 +1,185 @@
+"""Recording stand-in for maya.cmds, for benchmarks outside of Maya.
+
+    import monitor_stub
+    recorder = monitor_stub.install()
+    import monitor_core  # now bound to the recorder
+
+install() registers fake maya, maya.cmds, maya.api and maya.api.OpenMaya
+modules, so it has to run before anything imports Maya. Every cmds call is
+counted and charged a synthetic cost, and the commands that make nodes
+return unique names the way Maya does.
+"""
+import collections
+import fnmatch
+import sys
+import types
+
+
+# Synthetic seconds charged per call, roughly what each costs in a scene
+CALL_COSTS = {
+    'polyCube': 4e-4,
+    'polyExtrudeFacet': 6e-4,
+    'select': 2e-4,
+    'xform': 5e-5,
+    'group': 2e-4,
+    'instance': 1e-4,
+    'duplicate': 3e-4,
+    'setAttr': 2e-5,
+    'getAttr': 1e-5,
+    'addAttr': 5e-5,
+    'ls': 2e-5,
+    'objExists': 1e-5,
+}
+DEFAULT_COST = 5e-5
+# Maya resolves a clashing name by looking at every node already named
+# alike, and a wildcard ls walks the whole scene
+CLASH_COST = 2e-6
+SCAN_COST = 1e-7
+
+# DG nodes created per call: polyCube makes a transform, a shape and the
+# polyCube history node
+NODES_CREATED = {
+    'polyCube': 3,
+    'polyExtrudeFacet': 1,
+    'group': 1,
+    'instance': 1,
+    'duplicate': 1,
+}
+
+
+class RecordingCmds(types.ModuleType):
+    def __init__(self, costs=None):
+        super(RecordingCmds, self).__init__('maya.cmds')
+        self.costs = dict(CALL_COSTS, **(costs or {}))
+        self.reset()
+
+    def reset(self):
+        """Forget every recorded call and node"""
+        self.calls = collections.Counter()
+        self.synthetic_seconds = 0.0
+        self.nodes_created = 0
+        self._nodes = {}
+        self._uuids = {}
+        self._attrs = collections.defaultdict(dict)
+        self._name_counts = collections.Counter()
+        self._uuid_count = 0
+
+    def record(self, command):
+        self.calls[command] += 1
+        self.synthetic_seconds += self.costs.get(command, DEFAULT_COST)
+        self.nodes_created += NODES_CREATED.get(command, 0)
+
+    def __getattr__(self, command):
+        if command.startswith('__'):
+            raise AttributeError(command)
+
+        def run(*args, **kwargs):
+            self.record(command)
+        return run
+
+    def polyCube(self, name="pCube", **kwargs):
+        self.record('polyCube')
+        return [self._new_node(name, clash=True),
+                self._new_node("polyCube")]
+
+    def polyExtrudeFacet(self, *args, **kwargs):
+        self.record('polyExtrudeFacet')
+        return [self._new_node("polyExtrudeFace")]
+
+    def group(self, *args, name="group", **kwargs):
+        self.record('group')
+        return self._new_node(name, clash=True)
+
+    def instance(self, node, name="instance", **kwargs):
+        self.record('instance')
+        return [self._new_node(name, clash=True)]
+
+    def duplicate(self, node, name="duplicate", **kwargs):
+        self.record('duplicate')
+        return [self._new_node(name, clash=True)]
+
+    def objExists(self, node):
+        self.record('objExists')
+        node, _, attr = node.partition('.')
+        if attr:
+            return attr in self._attrs.get(_leaf(node), ())
+        return _leaf(node) in self._nodes
+
+    def addAttr(self, node, longName, **kwargs):
+        self.record('addAttr')
+        self._attrs[_leaf(node)].setdefault(longName, None)
+
+    def setAttr(self, plug, *values, **kwargs):
+        self.record('setAttr')
+        node, _, attr = plug.partition('.')
+        if _leaf(node) in self._nodes:
+            self._attrs[_leaf(node)][attr] = (values[0] if len(values) == 1
+                                              else values)
+
+    def getAttr(self, plug, **kwargs):
+        self.record('getAttr')
+        node, _, attr = plug.partition('.')
+        return self._attrs.get(_leaf(node), {}).get(attr)
+
+    def ls(self, *args, uuid=False, **kwargs):
+        self.record('ls')
+        nodes = []
+        for arg in args:
+            nodes.extend(_leaf(node) for node in
+                         (arg if isinstance(arg, (list, tuple)) else [arg]))
+        if len(nodes) == 1 and nodes[0].startswith('*.'):
+            # "*.attr" lists the nodes holding a dynamic attribute
+            attr = nodes[0][2:]
+            return [node for node, attrs in self._attrs.items()
+                    if attr in attrs]
+        if len(nodes) == 1 and '*' in nodes[0]:
+            self.synthetic_seconds += SCAN_COST * len(self._nodes)
+            return fnmatch.filter(self._nodes, nodes[0])
+        if uuid:
+            return [self._nodes[node] for node in nodes if node in self._nodes]
+        return [self._uuids.get(node, node) for node in nodes
+                if node in self._uuids or node in self._nodes]
+
+    def delete(self, *nodes, **kwargs):
+        self.record('delete')
+        for node in nodes:
+            for name in node if isinstance(node, (list, tuple)) else [node]:
+                name = _leaf(name)
+                self._uuids.pop(self._nodes.pop(name, None), None)
+                self._attrs.pop(name, None)
+
+    def _new_node(self, name, clash=False):
+        """Return a unique node name, charging for a clash on clash=True.
+
+        History nodes are auto-numbered without a scan, so only the names
+        callers ask for pay for a clash.
+        """
+        count = self._name_counts[name]
+        if clash and count:
+            self.synthetic_seconds += CLASH_COST * count
+        self._name_counts[name] += 1
+        node = f"{name}{count}" if count else name
+        self._uuid_count += 1
+        node_uuid = f"UUID-{self._uuid_count:08d}"
+        self._nodes[node] = node_uuid
+        self._uuids[node_uuid] = node
+        return node
+
+
+def _leaf(node):
+    # the stub names are unique, so a full path resolves by its last part
+    return node.rsplit('|', 1)[-1]
+
+
+def install(costs=None):
+    """Register the stub as maya.cmds and return the recorder"""
+    recorder = RecordingCmds(costs)
+    maya = types.ModuleType('maya')
+    api = types.ModuleType('maya.api')
+    open_maya = types.ModuleType('maya.api.OpenMaya')
+    maya.cmds = recorder
+    maya.api = api
+    api.OpenMaya = open_maya
+    sys.modules.update({'maya': maya, 'maya.cmds': recorder,
+                        'maya.api': api, 'maya.api.OpenMaya': open_maya})
+    return recorder
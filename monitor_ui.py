@@ -0,0 +1,383 @@
+import collections
+import functools
+import math
+
+import maya.OpenMayaUI as omui
+from PySide2 import QtWidgets
+from PySide2 import QtCore
+from PySide2 import QtGui
+from shiboken2 import wrapInstance
+
+import maya.cmds as cmds
+
+from monitor_core import Monitor
+from monitor_presets import PresetLibrary
+from monitor_scheduler import ChunkedGeneration
+
+
+# slider_scale is the slider steps per spinbox unit, None for no slider
+Param = collections.namedtuple('Param', 'name label default minimum maximum '
+                                        'step slider_scale')
+
+PARAM_ROWS = (
+    ("General |", (
+        Param('width', "Width:", 90, 0.0, 9999.99, 1.0, None),
+        Param('height', "Height:", 60, 0.0, 9999.99, 1.0, None),
+        Param('depth', "Depth:", 15, 0.0, 9999, 1.0, None),
+    )),
+    ("Panel (front) |", (
+        Param('panel_depth_ratio', "Relative depth:",
+              0.15, 0.05, 1.00, 0.05, 100),
+        Param('panel_height_ratio', "Relative height:",
+              0.8, 0.05, 1.00, 0.05, 100),
+    )),
+    ("Screen |", (
+        Param('screen_offset_amount', "Offset:", 2, 0.05, 5.00, 0.05, 100),
+        Param('scrn_extrsn_offset_amount', "Extrusion offset:",
+              0.4, 0.05, 5.00, 0.05, 100),
+        Param('screen_extrusion', "Extrusion amount:",
+              0.4, 0.05, 5.00, 0.05, 100),
+    )),
+    ("Panel (back) |", (
+        Param('b_panel_offset', "Offset:", 0.01, 0.05, 5.00, 0.05, 100),
+        Param('b_panel_extrsn_offset', "Extrusion offset:",
+              1, 0.05, 5.00, 0.05, 100),
+        Param('b_panel_extrsn', "Extrusion amount:",
+              3, 0.05, 20.00, 0.05, 100),
+    )),
+    ("Neck |", (
+        Param('neck_width_ratio', "Relative width:",
+              0.15, 0.05, 1.00, 0.05, 100),
+        Param('neck_height_ratio', "Relative height:",
+              0.2, 0.00, 1.00, 0.01, 100),
+        Param('neck_depth_ratio', "Relative depth:",
+              0.1, 0.05, 1.00, 0.05, 100),
+    )),
+    ("Base |", (
+        Param('base_width_ratio', "Relative width:",
+              0.25, 0.05, 1.00, 0.05, 100),
+        Param('base_height_ratio', "Relative height:",
+              0.05, 0.05, 1.00, 0.05, 100),
+        Param('base_depth_ratio', "Relative depth:",
+              1, 0.05, 1.00, 0.05, 100),
+    )),
+)
+
+PARAMS_BY_NAME = {param.name: param
+                  for _, row_params in PARAM_ROWS for param in row_params}
+
+DEFAULT_PRESET = "Flat-Panel Display"
+
+# grid spacing of a batch, in monitor widths
+BATCH_SPACING = 1.25
+
+
+def get_maya_main_win():
+    """Return the Maya main window widget"""
+    main_window = omui.MQtUtil.mainWindow()
+    return wrapInstance(int(main_window), QtWidgets.QWidget)
+
+
+class MonitorGeneratorWin(QtWidgets.QDialog):
+    """Monitor Generator Window class"""
+    # Emitted once per user edit or preset, never per synced widget
+    params_changed = QtCore.Signal()
+
+    def __init__(self):
+        super(MonitorGeneratorWin, self).__init__(parent=get_maya_main_win())
+        self.setWindowTitle("Monitor generator")
+        self.monitor_gen = Monitor()
+        self.monitor_gen.track_history = True
+        self.presets = PresetLibrary()
+        # False while the values are exactly those of the checked preset
+        self.preset_dirty = False
+        self.dspnbxs = {}
+        self.sliders = {}
+        # the running ChunkedGeneration, if any
+        self.batch = None
+        self._create_ui()
+        self._create_preview_timer()
+        self._create_batch_timer()
+
+    def _create_ui(self):
+        self.main_lay = QtWidgets.QVBoxLayout()
+        self._add_params_form()
+        self._add_batch_progress()
+        self._add_btns()
+        self.setLayout(self.main_lay)
+
+    def _add_params_form(self):
+        self.form_lay = QtWidgets.QFormLayout()
+        self._add_monitor_type_params()
+        for title, params in PARAM_ROWS:
+            self._add_params_row(title, params)
+        # only now, as checking it applies the preset to the spin boxes
+        default_btn = self.preset_radio_btns.get(DEFAULT_PRESET)
+        if default_btn is not None:
+            default_btn.setChecked(True)
+        self.count_spnbx = QtWidgets.QSpinBox()
+        self.count_spnbx.setRange(1, 100000)
+        self.form_lay.addRow(self.tr("Monitors to generate |"),
+                             self.count_spnbx)
+        self.main_lay.addLayout(self.form_lay)
+
+    def _add_batch_progress(self):
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_lbl = QtWidgets.QLabel()
+        self.main_lay.addWidget(self.progress_bar)
+        self.main_lay.addWidget(self.progress_lbl)
+        self.progress_bar.hide()
+        self.progress_lbl.hide()
+
+    def _add_monitor_type_params(self):
+        self.monitor_type_lay = QtWidgets.QHBoxLayout()
+        self.preset_radio_btns = {}
+
+        for preset_name in self.presets.names():
+            self._add_preset_radio_btn(preset_name)
+
+        self.form_lay.addRow(self.tr("Choose monitor type |"),
+                             self.monitor_type_lay)
+
+    def _add_preset_radio_btn(self, preset_name):
+        radio_btn = QtWidgets.QRadioButton(preset_name)
+        radio_btn.setIcon(QtGui.QIcon(""))  # add icon
+        radio_btn.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,
+                                QtWidgets.QSizePolicy.Preferred)
+        self.monitor_type_lay.addWidget(radio_btn)
+        self.preset_radio_btns[preset_name] = radio_btn
+        radio_btn.toggled.connect(
+              functools.partial(self._adjust_values_for_monitor_type,
+                                preset_name))
+        return radio_btn
+
+    def _add_params_row(self, title, params):
+        row_lay = QtWidgets.QHBoxLayout()
+        for param in params:
+            dspnbx = QtWidgets.QDoubleSpinBox()
+            dspnbx.setMinimumWidth(50)
+            dspnbx.setRange(param.minimum, param.maximum)
+            dspnbx.setSingleStep(param.step)
+            dspnbx.setValue(param.default)
+            row_lay.addWidget(QtWidgets.QLabel(param.label))
+            row_lay.addWidget(dspnbx)
+            self.dspnbxs[param.name] = dspnbx
+
+            if param.slider_scale is None:
+                dspnbx.setSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding,
+                                     QtWidgets.QSizePolicy.Preferred)
+            else:
+                slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
+                slider.setRange(int(param.minimum*param.slider_scale),
+                                int(param.maximum*param.slider_scale))
+                slider.setValue(int(round(dspnbx.value()*param.slider_scale)))
+                row_lay.addWidget(slider)
+                self.sliders[param.name] = slider
+                slider.valueChanged.connect(
+                                functools.partial(self._update_dspnbx, param))
+
+            dspnbx.valueChanged.connect(
+                                functools.partial(self._update_slider, param))
+
+        self.form_lay.addRow(self.tr(title), row_lay)
+
+    def _add_btns(self):
+        self.buttons_lay = QtWidgets.QHBoxLayout()
+        self.live_preview_chkbx = QtWidgets.QCheckBox("Live preview")
+        self.live_preview_chkbx.toggled.connect(self._toggle_live_preview)
+        self.buttons_lay.addWidget(self.live_preview_chkbx)
+        self.save_preset_btn = QtWidgets.QPushButton("Save preset...")
+        self.save_preset_btn.clicked.connect(self.save_preset)
+        self.buttons_lay.addWidget(self.save_preset_btn)
+        self.generate_btn = QtWidgets.QPushButton("Generate")
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.generate_btn.clicked.connect(self.generate)
+        self.cancel_btn.clicked.connect(self.cancel)
+        self.buttons_lay.addWidget(self.generate_btn)
+        self.buttons_lay.addWidget(self.cancel_btn)
+        self.main_lay.addLayout(self.buttons_lay)
+
+    def _create_preview_timer(self):
+        # Throttle: the first change starts the timer, every change until it
+        # fires is folded into the same update, so at most one per frame
+        self.preview_timer = QtCore.QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(16)
+        self.preview_timer.timeout.connect(self._update_preview)
+        self.params_changed.connect(self._schedule_preview)
+
+    def _create_batch_timer(self):
+        # 0 ms: one chunk per pass of the event loop, after pending redraws
+        # and input have been handled
+        self.batch_timer = QtCore.QTimer(self)
+        self.batch_timer.setInterval(0)
+        self.batch_timer.timeout.connect(self._step_batch)
+
+    @QtCore.Slot()
+    def _schedule_preview(self):
+        if self.live_preview_chkbx.isChecked() and \
+                not self.preview_timer.isActive():
+            self.preview_timer.start()
+
+    @QtCore.Slot(bool)
+    def _toggle_live_preview(self, checked):
+        if checked:
+            self._update_preview()
+
+    @QtCore.Slot()
+    def _update_preview(self):
+        self.set_monitor_properties()
+        cmds.undoInfo(openChunk=True, chunkName="monitor_preview")
+        try:
+            if not self.monitor_gen.update_monitor():
+                self.monitor_gen.make_monitor()
+        finally:
+            cmds.undoInfo(closeChunk=True)
+
+    def _adjust_values_for_monitor_type(self, preset_name, checked):
+        if checked:
+            self.set_params(self.presets.load(preset_name))
+            self.preset_dirty = False
+
+    def _checked_preset(self):
+        for preset_name, radio_btn in self.preset_radio_btns.items():
+            if radio_btn.isChecked():
+                return preset_name
+        return None
+
+    def _update_slider(self, param, value):
+        slider = self.sliders.get(param.name)
+        if slider is not None:
+            _set_blocked(slider, int(round(value*param.slider_scale)))
+        self.preset_dirty = True
+        self.params_changed.emit()
+
+    def _update_dspnbx(self, param, value):
+        _set_blocked(self.dspnbxs[param.name], value/param.slider_scale)
+        self.preset_dirty = True
+        self.params_changed.emit()
+
+    def get_params(self):
+        """Return the dialog values as a {name: value} spec"""
+        return {name: dspnbx.value() for name, dspnbx in self.dspnbxs.items()}
+
+    def set_params(self, spec):
+        """Set several values at once with a single params_changed"""
+        for name, value in spec.items():
+            dspnbx = self.dspnbxs[name]
+            _set_blocked(dspnbx, value)
+            slider = self.sliders.get(name)
+            if slider is not None:
+                scale = PARAMS_BY_NAME[name].slider_scale
+                _set_blocked(slider, int(round(dspnbx.value()*scale)))
+        self.params_changed.emit()
+
+    @QtCore.Slot()
+    def generate(self):
+        print("Generating table...")
+        self.set_monitor_properties()
+        if self.count_spnbx.value() > 1:
+            self._start_batch(self.count_spnbx.value())
+            return
+        preset_name = self._checked_preset()
+        if preset_name and not self.preset_dirty and \
+                self.presets.has_baked(preset_name):
+            self.presets.place(preset_name)
+        else:
+            self.monitor_gen.make_monitor()
+
+    @QtCore.Slot()
+    def save_preset(self):
+        preset_name, accepted = QtWidgets.QInputDialog.getText(
+                                        self, "Save preset", "Preset name:")
+        if not accepted or not preset_name:
+            return
+        answer = QtWidgets.QMessageBox.question(
+                        self, "Save preset",
+                        "Also store baked geometry for instant placement?")
+        self.presets.save(preset_name, self.get_params(),
+                          bake=answer == QtWidgets.QMessageBox.Yes)
+
+        radio_btn = self.preset_radio_btns.get(preset_name)
+        if radio_btn is None:
+            radio_btn = self._add_preset_radio_btn(preset_name)
+        radio_btn.setChecked(True)
+        self.preset_dirty = False
+
+    def _start_batch(self, count):
+        """Generate count monitors on a grid without blocking Maya"""
+        import monitor_layout
+
+        columns = int(math.ceil(math.sqrt(count)))
+        spacing = self.monitor_gen.width * BATCH_SPACING
+        layout = monitor_layout.grid(int(math.ceil(count / columns)),
+                                     columns, (spacing, spacing))
+        specs = monitor_layout.to_specs([{}] * count, layout)
+        self.batch = ChunkedGeneration(self.monitor_gen, specs)
+        self.batch.start()
+        self.progress_bar.setRange(0, count)
+        self.progress_bar.setValue(0)
+        self.progress_lbl.setText(self.batch.status())
+        self.progress_bar.show()
+        self.progress_lbl.show()
+        self._set_batch_running(True)
+        self.batch_timer.start()
+
+    @QtCore.Slot()
+    def _step_batch(self):
+        running = self.batch.step()
+        self.progress_bar.setValue(self.batch.built)
+        self.progress_lbl.setText(self.batch.status())
+        if not running:
+            error = self.batch.error
+            self._end_batch()
+            if error is not None:
+                QtWidgets.QMessageBox.warning(
+                        self, "Generate monitors",
+                        f"The batch failed and was rolled back: {error}")
+
+    def _end_batch(self):
+        self.batch_timer.stop()
+        self._set_batch_running(False)
+        self.progress_bar.hide()
+        self.progress_lbl.hide()
+        self.batch = None
+
+    def _set_batch_running(self, running):
+        # the parameters stay locked while the batch reads them
+        for widget in (list(self.dspnbxs.values()) +
+                       list(self.sliders.values()) +
+                       list(self.preset_radio_btns.values()) +
+                       [self.count_spnbx, self.live_preview_chkbx,
+                        self.save_preset_btn, self.generate_btn]):
+            widget.setEnabled(not running)
+
+    def _cancel_batch(self):
+        self.batch_timer.stop()
+        self.batch.cancel()
+        self._end_batch()
+
+    @QtCore.Slot()
+    def cancel(self):
+        if self.batch is not None:
+            print("Cancelling batch...")
+            self._cancel_batch()
+            return
+        print("Cancelling...")
+        self.set_monitor_properties()
+        self.close()
+
+    def closeEvent(self, event):
+        if self.batch is not None:
+            self._cancel_batch()
+        super(MonitorGeneratorWin, self).closeEvent(event)
+
+    def set_monitor_properties(self):
+        self.monitor_gen.set_params(self.get_params())
+
+
+def _set_blocked(widget, value):
+    """Set a widget value without emitting its change signals"""
+    blocked = widget.blockSignals(True)
+    widget.setValue(value)
+    widget.blockSignals(blocked)
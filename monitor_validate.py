@@ -0,0 +1,215 @@
+"""Vectorized pre-flight checks of monitor specs, run before any Maya call.
+
+    result = validate(SpecArray.from_specs(specs))
+    result.errors()     # {spec index: [reason, ...]} for the bad specs
+
+Each rule is one NumPy expression over the whole batch. The panel face
+checks mirror polyExtrudeFacet: an offset insets every edge of the face, so
+the screen and back insets (plus their extrusion offsets) must stay under
+half the smaller side of the panel, and the screen recess plus any inward
+back extrusion must stay thinner than the panel.
+
+clamp() pulls offsets and extrusions back inside those limits; zero or
+negative dimensions cannot be clamped to anything meaningful and stay
+invalid. preflight() is what Monitor.make_monitors(invalid=...) runs.
+"""
+import collections
+
+import numpy as np
+
+from monitor_geo import MONITOR_PARAMS
+from monitor_specs import SpecArray
+
+
+# smallest face side / panel thickness clamp() leaves
+MIN_SIZE = 1e-3
+
+INVALID_MODES = ("skip", "clamp")
+
+SIZE_PARAMS = ('width', 'height', 'depth', 'panel_height_ratio',
+               'panel_depth_ratio', 'neck_width_ratio', 'neck_height_ratio',
+               'neck_depth_ratio', 'base_width_ratio', 'base_height_ratio',
+               'base_depth_ratio')
+
+OFFSET_PARAMS = ('screen_offset_amount', 'scrn_extrsn_offset_amount',
+                 'b_panel_offset', 'b_panel_extrsn_offset')
+
+# the parameters clamp() may change
+CLAMPED_PARAMS = OFFSET_PARAMS + ('screen_extrusion', 'b_panel_extrsn')
+
+Preflight = collections.namedtuple('Preflight', 'specs rejected clamped')
+
+
+def _panel_limits(data):
+    """Return half the smaller panel face side and the panel thickness"""
+    half_face = np.minimum(data['width'],
+                           data['height'] * data['panel_height_ratio']) * .5
+    return half_face, data['depth'] * data['panel_depth_ratio']
+
+
+def _recesses(data):
+    """Return how far the screen and the back extrusions cut into the panel"""
+    return (np.maximum(data['screen_extrusion'], 0.0),
+            np.maximum(-data['b_panel_extrsn'], 0.0))
+
+
+def _not_finite(data):
+    return ~np.all([np.isfinite(data[name]) for name in MONITOR_PARAMS],
+                   axis=0)
+
+
+def _not_positive(name):
+    return lambda data: ~(data[name] > 0.0)
+
+
+def _negative(name):
+    return lambda data: data[name] < 0.0
+
+
+def _screen_inset(data):
+    return data['screen_offset_amount'] >= _panel_limits(data)[0]
+
+
+def _screen_extrusion_inset(data):
+    return (data['screen_offset_amount'] + data['scrn_extrsn_offset_amount']
+            >= _panel_limits(data)[0])
+
+
+def _back_inset(data):
+    return data['b_panel_offset'] >= _panel_limits(data)[0]
+
+
+def _back_extrusion_inset(data):
+    return (data['b_panel_offset'] + data['b_panel_extrsn_offset']
+            >= _panel_limits(data)[0])
+
+
+def _recess_depth(data):
+    screen, back = _recesses(data)
+    return screen + back >= _panel_limits(data)[1]
+
+
+# (reason, mask of the failing specs); the size rules cannot be clamped
+SIZE_RULES = ([("a parameter is NaN or infinite", _not_finite)] +
+              [(f"{name} must be positive", _not_positive(name))
+               for name in SIZE_PARAMS])
+
+CLAMPED_RULES = (
+    [(f"{name} must not be negative", _negative(name))
+     for name in OFFSET_PARAMS] +
+    [("screen_offset_amount is not under half the panel face",
+      _screen_inset),
+     ("screen_offset_amount + scrn_extrsn_offset_amount is not under half "
+      "the panel face", _screen_extrusion_inset),
+     ("b_panel_offset is not under half the panel face", _back_inset),
+     ("b_panel_offset + b_panel_extrsn_offset is not under half the panel "
+      "face", _back_extrusion_inset),
+     ("screen_extrusion and b_panel_extrsn cut through the panel",
+      _recess_depth)])
+
+RULES = SIZE_RULES + CLAMPED_RULES
+
+
+class Validation(object):
+    def __init__(self, failures, count):
+        # {reason: boolean mask over the batch}, failing rules only
+        self.failures = failures
+        self.count = count
+
+    @property
+    def invalid(self):
+        """Boolean mask of the specs breaking at least one rule"""
+        mask = np.zeros(self.count, dtype=bool)
+        for failed in self.failures.values():
+            mask |= failed
+        return mask
+
+    @property
+    def valid(self):
+        return ~self.invalid
+
+    def reasons(self, index):
+        return [reason for reason, failed in self.failures.items()
+                if failed[index]]
+
+    def errors(self):
+        """Return {spec index: [reason, ...]} for every invalid spec"""
+        return {int(index): self.reasons(index)
+                for index in np.flatnonzero(self.invalid)}
+
+    def __bool__(self):
+        return not self.failures
+
+
+def validate(specs, rules=RULES):
+    """Check a SpecArray against every rule at once"""
+    data = specs.data
+    failures = {}
+    with np.errstate(invalid='ignore'):
+        for reason, rule in rules:
+            failed = rule(data)
+            if failed.any():
+                failures[reason] = failed
+    return Validation(failures, len(data))
+
+
+def clamp(specs):
+    """Return a copy of a SpecArray with offsets and extrusions in range"""
+    data = specs.data.copy()
+    with np.errstate(invalid='ignore'):
+        half_face, thickness = _panel_limits(data)
+        max_inset = np.maximum(half_face - MIN_SIZE, 0.0)
+        for inset, extrusion_inset in (
+                ('screen_offset_amount', 'scrn_extrsn_offset_amount'),
+                ('b_panel_offset', 'b_panel_extrsn_offset')):
+            data[inset] = np.clip(data[inset], 0.0, max_inset)
+            data[extrusion_inset] = np.clip(data[extrusion_inset], 0.0,
+                                            max_inset - data[inset])
+
+        max_recess = np.maximum(thickness - MIN_SIZE, 0.0)
+        screen, back = _recesses(data)
+        back = np.minimum(back, max_recess)
+        data['b_panel_extrsn'] = np.where(data['b_panel_extrsn'] < 0.0,
+                                          -back, data['b_panel_extrsn'])
+        data['screen_extrusion'] = np.where(
+            data['screen_extrusion'] > 0.0,
+            np.minimum(screen, max_recess - back), data['screen_extrusion'])
+    return SpecArray(data)
+
+
+def preflight(specs, mode="skip", base=None):
+    """Validate {name: value} specs before building them.
+
+    base holds the parameters the specs override. Returns Preflight with the
+    specs to build, {index: reasons} of the rejected ones and, with mode
+    "clamp", {index: reasons} of the specs that were clamped. Clamped specs
+    are copies holding the clamped values.
+    """
+    if mode not in INVALID_MODES:
+        raise ValueError(f"Unknown invalid spec mode: {mode}")
+    specs = list(specs)
+    array = SpecArray.from_specs(specs, base=base)
+    result = validate(array)
+    clamped = {}
+    if mode == "clamp" and not result:
+        clamped = validate(array, CLAMPED_RULES).errors()
+        array = clamp(array)
+        result = validate(array)
+    rejected = result.errors()
+
+    accepted = []
+    columns = {}
+    if clamped:
+        columns = {name: array.data[name].tolist()
+                   for name in CLAMPED_PARAMS}
+    for index, spec in enumerate(specs):
+        if index in rejected:
+            continue
+        if index in clamped:
+            spec = dict(spec)
+            spec.update((name, values[index])
+                        for name, values in columns.items())
+        accepted.append(spec)
+    clamped = {index: reasons for index, reasons in clamped.items()
+               if index not in rejected}
+    return Preflight(accepted, rejected, clamped)
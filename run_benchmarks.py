@@ -0,0 +1,95 @@
+"""Run the monitor benchmarks against the recording maya.cmds stand-in.
+
+    python run_benchmarks.py            # compare with bench_baselines.json
+    python run_benchmarks.py --update   # store the current figures
+
+Exits with 1 when a figure regressed past its stored baseline, when
+"import monitor_gen" takes longer than --import-budget seconds or loads
+PySide2 or any other UI module, or when naming makes late chunks of a batch
+costlier than early ones.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+import monitor_stub
+
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'bench_baselines.json')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1, 100, 10000])
+    parser.add_argument('--baselines', default=BASELINES)
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="allowed timing slowdown, as a fraction")
+    parser.add_argument('--import-budget', type=float, default=0.1,
+                        help="seconds allowed for a headless "
+                             "import monitor_gen")
+    parser.add_argument('--update', action='store_true',
+                        help="write the results as the new baselines")
+    args = parser.parse_args(argv)
+
+    recorder = monitor_stub.install()
+    import monitor_bench
+
+    # make_monitors prints a line per batch, keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = monitor_bench.bench_batches(recorder, args.sizes)
+
+    print(f"{'batch':>6} {'calls/mon':>10} {'nodes/mon':>10} "
+          f"{'synth ms/mon':>13} {'wall ms/mon':>12}")
+    for size, figures in results.items():
+        print(f"{size:>6} {figures['calls_per_monitor']:>10.2f} "
+              f"{figures['nodes_per_monitor']:>10.2f} "
+              f"{figures['synthetic_ms_per_monitor']:>13.4f} "
+              f"{figures['wall_ms_per_monitor']:>12.4f}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        naming_ratios, naming_failures = monitor_bench.check_naming_scaling(
+                                                                    recorder)
+    print("naming, last/first chunk: " + ", ".join(
+        f"{mode} {ratio:.2f}x" for mode, ratio in naming_ratios.items()))
+
+    import_seconds, ui_modules = monitor_bench.bench_import()
+    print(f"import monitor_gen: {import_seconds * 1000:.1f} ms "
+          f"(budget {args.import_budget * 1000:.0f} ms)")
+    failures = []
+    if import_seconds > args.import_budget:
+        failures.append(f"import monitor_gen took {import_seconds:.3f}s, "
+                        f"over the {args.import_budget}s budget")
+    if ui_modules:
+        failures.append(f"import monitor_gen loaded {', '.join(ui_modules)}")
+    for failure in failures:
+        print(f"IMPORT {failure}")
+    for failure in naming_failures:
+        print(f"NAMING {failure}")
+    failures.extend(naming_failures)
+
+    if args.update:
+        with open(args.baselines, 'w') as baselines_file:
+            json.dump(results, baselines_file, indent=4, sort_keys=True)
+            baselines_file.write('\n')
+        print(f"Baselines written to {args.baselines}")
+        return 1 if failures else 0
+
+    if not os.path.isfile(args.baselines):
+        print("No baselines yet, run with --update to store them")
+        return 1 if failures else 0
+    with open(args.baselines) as baselines_file:
+        baselines = json.load(baselines_file)
+    regressions = monitor_bench.find_regressions(results, baselines,
+                                                 args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions or failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())